@@ -81,11 +81,8 @@ def calculate_checksum(file_path: Path) -> str:
     Returns:
         Hex-encoded SHA256 hash.
     """
-    sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def verify_checksum(file_path: Path, expected: str) -> bool:
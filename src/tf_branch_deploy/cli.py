@@ -12,57 +12,131 @@ from __future__ import annotations
 
 import json
 import os
-import uuid
+import re
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from enum import Enum
-from importlib.metadata import PackageNotFoundError, version
+from itertools import count
 from pathlib import Path, PurePosixPath, PureWindowsPath
 from typing import TYPE_CHECKING, Annotated
 
+import typer
+
 if TYPE_CHECKING:
+    from rich.console import Console
+
     from .config import EnvironmentConfig, TerraformBranchDeployConfig
     from .executor import TerraformExecutor
 
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from .config import load_config
-from .executor import _redact_args
-
 DEFAULT_CONFIG_PATH = Path(".tf-branch-deploy.yml")
+PACKAGED_SCHEMA_FILE = "schema.json"
 GITHUB_URL_DEFAULT = "https://github.com"
 ACTIONS_RUNS_PATH = "/actions/runs/"
 
+# Step output names written by the CLI and read back by action.yml.
+OUTPUT_FAILURE_REASON = "failure_reason"
+OUTPUT_WORKING_DIRECTORY = "working_directory"
+OUTPUT_VAR_FILES = "var_files"
+OUTPUT_IS_PRODUCTION = "is_production"
+OUTPUT_PLAN_FILE = "plan_file"
+OUTPUT_PLAN_CHECKSUM = "plan_checksum"
+OUTPUT_HAS_CHANGES = "has_changes"
+OUTPUT_PLAN_PARAMS_HASH = "plan_params_hash"
+OUTPUT_PLAN_TERRAFORM_VERSION = "plan_terraform_version"
+OUTPUT_PARAMS_HASH = "params_hash"
+OUTPUT_INTENT_ARTIFACT_NAME = "intent_artifact_name"
+OUTPUT_INTENT_FILE = "intent_file"
+OUTPUT_ARTIFACT_NAME = "artifact_name"
+
 app = typer.Typer(
     name="tf-branch-deploy",
     help="ChatOps for Terraform infrastructure deployments via GitHub PRs.",
     no_args_is_help=True,
 )
-console = Console()
 
 
-class Mode(str, Enum):
-    """Execution mode for action.yml."""
+class _LazyConsole:
+    """Stand-in for the Rich console that imports Rich on first use.
+
+    Rich, like the config and executor modules, is imported lazily so quick
+    commands (environments, get-config) and early exits skip its import cost.
+    """
+
+    _console: Console | None = None
+
+    def __getattr__(self, name: str) -> object:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console: Console = _LazyConsole()  # type: ignore[assignment]
 
-    TRIGGER = "trigger"  # Parse command, export TF_BD_* env vars, STOP
-    EXECUTE = "execute"  # Run terraform with lifecycle completion
+
+# Output records waiting for a single append to GITHUB_OUTPUT; None when unbatched.
+_pending_outputs: list[str] | None = None
+
+# Heredoc delimiters only have to be absent from the value and unguessable by
+# whoever controls it: one random token per process plus a counter is enough.
+_DELIMITER_TOKEN = os.urandom(16).hex()
+_delimiter_serial = count()
 
 
 def set_github_output(name: str, value: str) -> None:
     """Set a GitHub Actions output."""
-    output_file = os.environ.get("GITHUB_OUTPUT")
-    if output_file:
-        delimiter = f"TFBD_{name}_{uuid.uuid4().hex}"
-        while delimiter in value:
-            delimiter = f"TFBD_{name}_{uuid.uuid4().hex}"
+    delimiter = f"TFBD_{name}_{_DELIMITER_TOKEN}_{next(_delimiter_serial)}"
+    while delimiter in value:
+        delimiter = f"TFBD_{name}_{_DELIMITER_TOKEN}_{next(_delimiter_serial)}"
+    record = f"{name}<<{delimiter}\n{value}\n{delimiter}\n"
 
-        with open(output_file, "a", encoding="utf-8") as f:
-            f.write(f"{name}<<{delimiter}\n{value}\n{delimiter}\n")
+    if _pending_outputs is not None:
+        _pending_outputs.append(record)
+    else:
+        _append_github_outputs([record])
 
+    # Plain breadcrumb: this runs for every output, so skip Rich markup rendering.
     preview = value.replace("\r", "\\r").replace("\n", "\\n")
-    console.print(f"[dim]Output: {name}={preview[:50]}{'...' if len(preview) > 50 else ''}[/dim]")
+    sys.stderr.write(f"Output: {name}={preview[:50]}{'...' if len(preview) > 50 else ''}\n")
+
+
+def _append_github_outputs(records: list[str]) -> None:
+    """Append output records to the GITHUB_OUTPUT file in one write, if it is set."""
+    output_file = os.environ.get("GITHUB_OUTPUT")
+    if output_file and records:
+        with open(output_file, "a", encoding="utf-8") as f:
+            f.write("".join(records))
+
+
+@contextmanager
+def _batched_github_outputs() -> Iterator[None]:
+    """Hold set_github_output writes and flush them with a single append.
+
+    The flush also runs when the command fails, so failure_reason is never lost.
+    Nested uses join the outermost batch.
+    """
+    global _pending_outputs
+    if _pending_outputs is not None:
+        yield
+        return
+
+    _pending_outputs = []
+    try:
+        yield
+    finally:
+        records, _pending_outputs = _pending_outputs, None
+        _append_github_outputs(records)
+
+
+def set_github_output_json(name: str, value: list[str]) -> None:
+    """Set a GitHub Actions output to the JSON encoding of a string list.
+
+    Encoding happens here rather than at the call site, and the common empty
+    list is written as a literal without invoking the encoder.
+    """
+    set_github_output(name, json.dumps(value) if value else "[]")
 
 
 def format_error_for_comment(
@@ -89,21 +163,20 @@ def format_error_for_comment(
     Returns:
         Formatted markdown string for the comment
     """
-    lines = [message]
+    # Each optional part carries its own leading newline so joining on "\n"
+    # yields one blank line between paragraphs.
+    parts = [message]
 
     if details:
-        lines.append("")
-        lines.append(details)
+        parts.append(f"\n{details}")
 
     if logs_url:
-        lines.append("")
-        lines.append(f"📋 [View workflow logs]({logs_url})")
+        parts.append(f"\n📋 [View workflow logs]({logs_url})")
 
     if suggestion:
-        lines.append("")
-        lines.append(f"> {suggestion}")
+        parts.append(f"\n> {suggestion}")
 
-    return "\n".join(lines)
+    return "\n".join(parts)
 
 
 ALLOWED_EXTRA_ARG_FLAGS: frozenset[str] = frozenset(
@@ -163,6 +236,9 @@ BLOCKED_EXTRA_ARG_FLAGS: frozenset[str] = frozenset(
 
 VALID_OPERATIONS: frozenset[str] = frozenset({"plan", "apply", "rollback"})
 
+# "flag=" followed by a value wrapped in a matching pair of outer shell quotes.
+SHELL_QUOTED_VALUE_RE = re.compile(r"^([^=]*=)(['\"])(.*)\2\Z", re.DOTALL)
+
 NON_PLAN_EXTRA_ARGS_ERROR = (
     "Extra Terraform arguments are only supported on plan commands. "
     "Apply uses the saved plan. Rollback applies the stable branch directly; "
@@ -172,6 +248,8 @@ NON_PLAN_EXTRA_ARGS_ERROR = (
 
 def _package_version() -> str:
     """Return the installed package version for command output."""
+    from importlib.metadata import PackageNotFoundError, version
+
     try:
         return version("tf-branch-deploy")
     except PackageNotFoundError:
@@ -180,9 +258,31 @@ def _package_version() -> str:
 
 def _redact_args_for_display(args: list[str]) -> str:
     """Redact argument values before showing PR-supplied or metadata args."""
+    from .executor import _redact_args
+
     return _redact_args(args)
 
 
+def _print_banner(subtitle: str) -> None:
+    """Print the command banner panel (a plain line when not on a terminal)."""
+    if not console.is_terminal:
+        console.print(
+            f"Terraform Branch Deploy v{_package_version()} - {subtitle}",
+            markup=False,
+            highlight=False,
+        )
+        return
+
+    from rich.panel import Panel
+
+    console.print(
+        Panel.fit(
+            f"[bold blue]Terraform Branch Deploy[/bold blue] v{_package_version()}",
+            subtitle=subtitle,
+        )
+    )
+
+
 def _arg_flag(arg: str) -> str:
     """Return the flag portion of a Terraform argument."""
     return arg.split("=", 1)[0] if "=" in arg else arg
@@ -346,7 +446,7 @@ def _resolve_extra_plan_args(
     if operation != "plan" and raw_extra_args and raw_extra_args.strip():
         msg = NON_PLAN_EXTRA_ARGS_ERROR
         console.print(f"[red]❌ {msg}[/red]")
-        set_github_output("failure_reason", msg)
+        set_github_output(OUTPUT_FAILURE_REASON, msg)
         raise typer.Exit(1)
 
     if not raw_extra_args:
@@ -379,16 +479,36 @@ def _print_execution_table(
     parsed_extra_args: list[str],
 ) -> None:
     """Display execution context without exposing sensitive variable values."""
-    table = Table(title="Terraform Execution")
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="green")
-    table.add_row("Environment", environment)
-    table.add_row("Operation", operation)
-    table.add_row("SHA", sha[:8])
-    table.add_row("Working Dir", str(working_dir))
-    table.add_row("Dry Run", str(dry_run))
+    rows = [
+        ("Environment", environment),
+        ("Operation", operation),
+        ("SHA", sha[:8]),
+        ("Working Dir", str(working_dir)),
+        ("Dry Run", str(dry_run)),
+    ]
     if parsed_extra_args:
-        table.add_row("Extra Args", _redact_args_for_display(parsed_extra_args))
+        rows.append(("Extra Args", _redact_args_for_display(parsed_extra_args)))
+    _print_table("Terraform Execution", ("Setting", "Value"), rows)
+
+
+def _print_table(title: str, columns: tuple[str, str], rows: list[tuple[str, str]]) -> None:
+    """Print a two-column table, or plain "key: value" lines when not on a terminal.
+
+    CI logs strip box drawing anyway, so Rich layout is only paid for on a TTY.
+    """
+    if not console.is_terminal:
+        console.print(title, markup=False, highlight=False)
+        for key, value in rows:
+            console.print(f"  {key}: {value}", markup=False, highlight=False)
+        return
+
+    from rich.table import Table
+
+    table = Table(title=title)
+    table.add_column(columns[0], style="cyan")
+    table.add_column(columns[1], style="green")
+    for key, value in rows:
+        table.add_row(key, value)
     console.print(table)
 
 
@@ -403,9 +523,9 @@ def _print_dry_run_commands(
     """Print the Terraform commands that would run in dry-run mode."""
     console.print("\n[yellow]🧪 Dry run - commands would be:[/yellow]")
     console.print(f"  cd {working_dir}")
-    console.print(f"  {_redact_args(['terraform', 'init', *init_args])}")
+    console.print(f"  {_redact_args_for_display(['terraform', 'init', *init_args])}")
     if operation == "plan":
-        console.print(f"  {_redact_args(['terraform', 'plan', *plan_args])}")
+        console.print(f"  {_redact_args_for_display(['terraform', 'plan', *plan_args])}")
     elif operation == "apply":
         console.print("  terraform apply <saved plan file>")
     else:
@@ -413,7 +533,7 @@ def _print_dry_run_commands(
         for var_file in var_files:
             rollback_args.extend(["-var-file", var_file])
         rollback_args.extend(apply_args)
-        console.print(f"  {_redact_args(['terraform', 'apply', *rollback_args])}")
+        console.print(f"  {_redact_args_for_display(['terraform', 'apply', *rollback_args])}")
 
 
 def _pr_number_from_env() -> int | None:
@@ -507,26 +627,16 @@ def _strip_shell_quotes(arg: str) -> str:
         -var='msg=hello world' -> -var=msg=hello world
         -target=module.test["key"] -> -target=module.test["key"] (preserve inner quotes)
     """
-    eq_pos = arg.find("=")
-    if eq_pos == -1:
-        return arg
-
-    flag = arg[: eq_pos + 1]
-    value = arg[eq_pos + 1 :]
-
-    if len(value) >= 2 and (
-        (value.startswith("'") and value.endswith("'"))
-        or (value.startswith('"') and value.endswith('"'))
-    ):
-        value = value[1:-1]
-
-    return flag + value
+    match = SHELL_QUOTED_VALUE_RE.match(arg)
+    return match.group(1) + match.group(3) if match else arg
 
 
 def _load_and_validate_config(
     config_path: Path, environment: str
 ) -> tuple["TerraformBranchDeployConfig", "EnvironmentConfig"]:
     """Load and validate config, returning config and environment config."""
+    from .config import load_config
+
     try:
         config = load_config(config_path)
     except FileNotFoundError:
@@ -560,6 +670,8 @@ def get_config(
 
     Replaces yq usage in action.yml for robust, dependency-free config parsing.
     """
+    from .config import load_config
+
     try:
         config = load_config(config_path)
     except FileNotFoundError:
@@ -586,50 +698,76 @@ def complete_lifecycle(
     ] = None,
 ) -> None:
     """Complete the deployment lifecycle (update status, reactions, comments)."""
-    from .lifecycle import LifecycleManager
-
     # Gather context from env vars
-    env_vars = dict(os.environ)
-    repo = env_vars.get("GH_REPO") or env_vars.get("GITHUB_REPOSITORY")
-    token = env_vars.get("GITHUB_TOKEN")
+    env = os.environ
+    repo = env.get("GH_REPO") or env.get("GITHUB_REPOSITORY")
+    token = env.get("GITHUB_TOKEN")
 
     if not repo or not token:
         console.print("[red]Error:[/red] GH_REPO/GITHUB_REPOSITORY or GITHUB_TOKEN not set")
         raise typer.Exit(1)
 
+    # Imported only once the environment is known to be usable (fail fast).
+    from .lifecycle import LifecycleManager
+
     manager = LifecycleManager(repo=repo, github_token=token)
+    # Steps 1-4 are independent GitHub API calls (one gh process each).
+    calls: list[tuple[Callable[..., None], tuple[str, ...]]] = []
 
     # 1. Update deployment status
-    deployment_id = env_vars.get("TF_BD_DEPLOYMENT_ID")
-    environment = env_vars.get("TF_BD_ENVIRONMENT")
+    deployment_id = env.get("TF_BD_DEPLOYMENT_ID")
+    environment = env.get("TF_BD_ENVIRONMENT")
     if deployment_id and environment:
-        manager.update_deployment_status(deployment_id, status, environment)
+        calls.append((manager.update_deployment_status, (deployment_id, status, environment)))
 
     # 2. Remove initial reaction
-    comment_id = env_vars.get("TF_BD_COMMENT_ID")
-    reaction_id = env_vars.get("TF_BD_INITIAL_REACTION_ID")
+    comment_id = env.get("TF_BD_COMMENT_ID")
+    reaction_id = env.get("TF_BD_INITIAL_REACTION_ID")
     if comment_id and reaction_id:
-        manager.remove_reaction(comment_id, reaction_id)
+        calls.append((manager.remove_reaction, (comment_id, reaction_id)))
 
     # 3. Add result reaction
     reaction = "rocket" if status == "success" else "-1"
     if comment_id:
-        manager.add_reaction(comment_id, reaction)
+        calls.append((manager.add_reaction, (comment_id, reaction)))
 
-    # 4. Post result comment
-    pr_number = env_vars.get("TF_BD_PR_NUMBER")
+    # 4. Post result comment (only the TF_BD_* context feeds the comment)
+    pr_number = env.get("TF_BD_PR_NUMBER")
     if pr_number:
-        body = manager.format_result_comment(status, env_vars, failure_reason)
-        manager.post_result_comment(pr_number, body)
+        tf_bd_vars = {k: v for k, v in env.items() if k.startswith("TF_BD_")}
+        body = manager.format_result_comment(status, tf_bd_vars, failure_reason)
+        calls.append((manager.post_result_comment, (pr_number, body)))
+
+    _run_concurrently(calls)
 
-    # 5. Remove non-sticky lock
+    # 5. Remove non-sticky lock, once everything else has been reported
     if environment:
         manager.remove_non_sticky_lock(environment)
 
     console.print("\n[green]✅ Lifecycle complete[/green]")
 
 
+def _run_concurrently(calls: list[tuple[Callable[..., None], tuple[str, ...]]]) -> None:
+    """Run independent calls on a small thread pool and re-raise the first error.
+
+    Each lifecycle call is a gh subprocess plus an HTTPS round trip, so running
+    them together makes completion take as long as the slowest call.
+    """
+    if len(calls) <= 1:
+        for fn, args in calls:
+            fn(*args)
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as pool:
+        futures = [pool.submit(fn, *args) for fn, args in calls]
+    for future in futures:
+        future.result()
+
+
 @app.command(name="declare-plan-intent")
+@_batched_github_outputs()
 def declare_plan_intent(
     environment: Annotated[str, typer.Option("--environment", "-e", help="Target environment")],
     sha: Annotated[str, typer.Option("--sha", "-s", help="Git commit SHA")],
@@ -648,12 +786,7 @@ def declare_plan_intent(
     """
     from .artifacts import generate_params_hash, plan_intent_prefix
 
-    console.print(
-        Panel.fit(
-            f"[bold blue]Terraform Branch Deploy[/bold blue] v{_package_version()}",
-            subtitle="Declare Plan Intent",
-        )
-    )
+    _print_banner("Declare Plan Intent")
 
     _load_and_validate_config(config_path, environment)
 
@@ -665,7 +798,7 @@ def declare_plan_intent(
             "plan intent. Review the workflow logs for details."
         )
         console.print(f"[red]❌ {msg}[/red]")
-        set_github_output("failure_reason", msg)
+        set_github_output(OUTPUT_FAILURE_REASON, msg)
         raise typer.Exit(1)
 
     params_hash = generate_params_hash(os.environ.get("TF_BD_EXTRA_ARGS"))
@@ -687,12 +820,13 @@ def declare_plan_intent(
     )
 
     console.print(f"[green]✅ Plan intent declared:[/green] {intent_name}")
-    set_github_output("params_hash", params_hash)
-    set_github_output("intent_artifact_name", intent_name)
-    set_github_output("intent_file", str(intent_file))
+    set_github_output(OUTPUT_PARAMS_HASH, params_hash)
+    set_github_output(OUTPUT_INTENT_ARTIFACT_NAME, intent_name)
+    set_github_output(OUTPUT_INTENT_FILE, str(intent_file))
 
 
 @app.command(name="restore-plan")
+@_batched_github_outputs()
 def restore_plan(
     environment: Annotated[str, typer.Option("--environment", "-e", help="Target environment")],
     sha: Annotated[str, typer.Option("--sha", "-s", help="Git commit SHA")],
@@ -720,12 +854,7 @@ def restore_plan(
         plan_artifact_name_from_intent,
     )
 
-    console.print(
-        Panel.fit(
-            f"[bold blue]Terraform Branch Deploy[/bold blue] v{_package_version()}",
-            subtitle="Restore Plan",
-        )
-    )
+    _print_banner("Restore Plan")
 
     _, env_config = _load_and_validate_config(config_path, environment)
     resolved_working_dir = Path(working_dir or env_config.working_directory)
@@ -735,7 +864,7 @@ def restore_plan(
     if not repo or not token:
         console.print("[red]Error:[/red] GH_REPO/GITHUB_REPOSITORY or GITHUB_TOKEN not set")
         set_github_output(
-            "failure_reason",
+            OUTPUT_FAILURE_REASON,
             "The deployment workflow is misconfigured: no GitHub token was available "
             "to restore the saved plan. Review the workflow logs for details.",
         )
@@ -759,7 +888,7 @@ def restore_plan(
                 f"then run `.plan to {environment}` and `.apply to {environment}` again"
             ),
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1) from None
 
     if intent is None:
@@ -780,7 +909,7 @@ def restore_plan(
             ),
             suggestion=f"Run `.plan to {environment}` first, then `.apply to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     console.print(
@@ -798,7 +927,7 @@ def restore_plan(
             logs_url=_workflow_logs_url(),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1) from None
 
     if candidate is None:
@@ -818,7 +947,7 @@ def restore_plan(
                 f"before running `.apply to {environment}`"
             ),
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     console.print(
@@ -836,7 +965,7 @@ def restore_plan(
             logs_url=_workflow_logs_url(),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1) from None
 
     plan_file = resolved_working_dir / generate_artifact_name(environment, sha)
@@ -850,16 +979,17 @@ def restore_plan(
             ),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     for path in extracted:
         console.print(f"[dim]📥 Restored: {path}[/dim]")
-    set_github_output("artifact_name", candidate.name)
+    set_github_output(OUTPUT_ARTIFACT_NAME, candidate.name)
     console.print("\n[green]✅ Plan artifact restored[/green]")
 
 
 @app.command()
+@_batched_github_outputs()
 def execute(
     environment: Annotated[str, typer.Option("--environment", "-e", help="Target environment")],
     operation: Annotated[str, typer.Option("--operation", "-o", help="plan, apply, or rollback")],
@@ -889,12 +1019,7 @@ def execute(
     Dynamic args can be passed via PR comment:
       .plan to dev | -target=module.base -target=module.network
     """
-    console.print(
-        Panel.fit(
-            f"[bold blue]Terraform Branch Deploy[/bold blue] v{_package_version()}",
-            subtitle="Execute Mode",
-        )
-    )
+    _print_banner("Execute Mode")
 
     config, env_config = _load_and_validate_config(config_path, environment)
     resolved_working_dir = Path(working_dir or env_config.working_directory)
@@ -902,7 +1027,7 @@ def execute(
     if operation not in VALID_OPERATIONS:
         msg = f"Unknown operation: {operation}"
         console.print(f"[red]{msg}[/red]")
-        set_github_output("failure_reason", msg)
+        set_github_output(OUTPUT_FAILURE_REASON, msg)
         raise typer.Exit(1)
 
     raw_extra_args = extra_args or os.environ.get("TF_BD_EXTRA_ARGS")
@@ -915,17 +1040,17 @@ def execute(
         environment, operation, sha, resolved_working_dir, dry_run, parsed_extra_args
     )
 
-    var_files = config.resolve_var_files(environment)
-    backend_configs = config.resolve_backend_configs(environment)
-    init_args = config.resolve_args(environment, "init_args")
-    config_plan_args = config.resolve_args(environment, "plan_args")
-    apply_args = config.resolve_args(environment, "apply_args")
-    _validate_config_args(config_plan_args, apply_args)
-    plan_args = config_plan_args + parsed_extra_args
+    resolved = config.resolve(environment)
+    var_files = list(resolved.var_files)
+    backend_configs = list(resolved.backend_configs)
+    init_args = list(resolved.init_args)
+    apply_args = list(resolved.apply_args)
+    _validate_config_args(list(resolved.plan_args), apply_args)
+    plan_args = [*resolved.plan_args, *parsed_extra_args]
 
-    set_github_output("working_directory", str(resolved_working_dir))
-    set_github_output("var_files", json.dumps(var_files))
-    set_github_output("is_production", str(config.is_production(environment)).lower())
+    set_github_output(OUTPUT_WORKING_DIRECTORY, str(resolved_working_dir))
+    set_github_output_json(OUTPUT_VAR_FILES, var_files)
+    set_github_output(OUTPUT_IS_PRODUCTION, str(resolved.is_production).lower())
 
     if dry_run:
         _print_dry_run_commands(
@@ -935,29 +1060,42 @@ def execute(
 
     from .executor import TerraformExecutor
 
-    executor = TerraformExecutor(
-        working_directory=resolved_working_dir,
-        var_files=var_files,
-        backend_configs=backend_configs,
-        init_args=init_args,
-        plan_args=plan_args,
-        apply_args=apply_args,
-        github_token=os.environ.get("TFBD_GITHUB_TOKEN") or os.environ.get("GITHUB_TOKEN"),
-        repo=os.environ.get("GITHUB_REPOSITORY"),
-        pr_number=_pr_number_from_env(),
-        timeout=env_config.timeout,
-    )
+    try:
+        executor = TerraformExecutor(
+            working_directory=resolved_working_dir,
+            var_files=var_files,
+            backend_configs=backend_configs,
+            init_args=init_args,
+            plan_args=plan_args,
+            apply_args=apply_args,
+            github_token=os.environ.get("TFBD_GITHUB_TOKEN") or os.environ.get("GITHUB_TOKEN"),
+            repo=os.environ.get("GITHUB_REPOSITORY"),
+            pr_number=_pr_number_from_env(),
+            timeout=env_config.timeout,
+            stream_output=True,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        set_github_output(OUTPUT_FAILURE_REASON, str(e))
+        raise typer.Exit(1) from None
 
     init_result = executor.init()
     if not init_result.success:
         console.print("[red]Terraform init failed[/red]")
         set_github_output(
-            "failure_reason", "Terraform initialization failed. Check logs for details."
+            OUTPUT_FAILURE_REASON, "Terraform initialization failed. Check logs for details."
         )
         raise typer.Exit(1)
 
     if operation == "plan":
-        _handle_plan(executor, environment, sha, plan_args, var_files, raw_extra_args)
+        _handle_plan(
+            executor,
+            environment,
+            sha,
+            plan_args,
+            var_files,
+            raw_extra_args,
+        )
     else:
         _handle_apply(
             executor,
@@ -979,7 +1117,6 @@ def _handle_plan(
     raw_extra_args: str | None = None,
 ) -> None:
     """Handle terraform plan operation."""
-
     plan_file = Path(f"tfplan-{environment}-{sha[:8]}.tfplan")
     result = executor.plan(out_file=plan_file)
     if not result.success:
@@ -988,13 +1125,13 @@ def _handle_plan(
             logs_url=_workflow_logs_url(),
             suggestion=f"Fix any configuration errors and run `.plan to {environment}` again",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     if result.plan_file and result.checksum:
-        set_github_output("plan_file", str(result.plan_file))
-        set_github_output("plan_checksum", result.checksum)
-        set_github_output("has_changes", str(result.has_changes).lower())
+        set_github_output(OUTPUT_PLAN_FILE, str(result.plan_file))
+        set_github_output(OUTPUT_PLAN_CHECKSUM, result.checksum)
+        set_github_output(OUTPUT_HAS_CHANGES, str(result.has_changes).lower())
 
         # Save plan metadata sidecar for cross-run integrity verification
         from .artifacts import PlanMetadata, generate_params_hash, save_plan_metadata
@@ -1017,8 +1154,8 @@ def _handle_plan(
         meta_path = save_plan_metadata(result.plan_file, metadata)
         console.print(f"[dim]📝 Plan metadata saved: {meta_path.name}[/dim]")
 
-        set_github_output("plan_params_hash", params_hash)
-        set_github_output("plan_terraform_version", tf_version)
+        set_github_output(OUTPUT_PLAN_PARAMS_HASH, params_hash)
+        set_github_output(OUTPUT_PLAN_TERRAFORM_VERSION, tf_version)
 
 
 def _handle_apply(
@@ -1029,8 +1166,7 @@ def _handle_apply(
     is_rollback: bool | None = None,
 ) -> None:
     """Handle terraform apply operation."""
-    plan_filename = f"tfplan-{environment}-{sha[:8]}.tfplan"
-    plan_file = working_dir / plan_filename
+    plan_file = working_dir / f"tfplan-{environment}-{sha[:8]}.tfplan"
     if is_rollback is None:
         is_rollback = os.environ.get("TF_BD_IS_ROLLBACK", "false").lower() == "true"
     raw_extra_args = os.environ.get("TF_BD_EXTRA_ARGS", "")
@@ -1038,7 +1174,7 @@ def _handle_apply(
     if raw_extra_args.strip():
         msg = NON_PLAN_EXTRA_ARGS_ERROR
         console.print(f"[red]❌ {msg}[/red]")
-        set_github_output("failure_reason", msg)
+        set_github_output(OUTPUT_FAILURE_REASON, msg)
         raise typer.Exit(1)
 
     if is_rollback:
@@ -1056,7 +1192,7 @@ def _handle_apply(
                 logs_url=_workflow_logs_url(),
                 suggestion="Ensure the `main` branch has valid Terraform configuration and remote state is accessible",
             )
-            set_github_output("failure_reason", error_msg)
+            set_github_output(OUTPUT_FAILURE_REASON, error_msg)
             raise typer.Exit(1)
         console.print("[dim]📋 Rollback applied directly (no plan file)[/dim]")
     elif plan_file.exists():
@@ -1074,7 +1210,7 @@ def _handle_apply(
             sha,
             expected_params_hash=expected_params_hash,
         )
-        console.print(f"[dim]📋 Plan applied: {plan_filename}[/dim]")
+        console.print(f"[dim]📋 Plan applied: {plan_file.name}[/dim]")
     else:
         console.print(f"[red]❌ No plan file found for this SHA: {plan_file}[/red]")
         error_msg = format_error_for_comment(
@@ -1082,7 +1218,7 @@ def _handle_apply(
             details=f"- Run `.plan to {environment}` to create a plan\n- For rollback to stable: `.apply main to {environment}`",
             suggestion=f"Run `.plan to {environment}` first, then `.apply to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         console.print(
             f"[yellow]💡 You must run '.plan to {environment}' before '.apply to {environment}'[/yellow]"
         )
@@ -1117,7 +1253,7 @@ def _apply_with_plan(
             ),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     if metadata.environment != environment:
@@ -1128,7 +1264,7 @@ def _apply_with_plan(
             ),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     if metadata.sha != sha:
@@ -1139,7 +1275,7 @@ def _apply_with_plan(
             ),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     if expected_params_hash is None:
@@ -1150,7 +1286,7 @@ def _apply_with_plan(
             ),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     if metadata.params_hash != expected_params_hash:
@@ -1162,7 +1298,7 @@ def _apply_with_plan(
             ),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
     if not verify_checksum(plan_file, metadata.checksum):
@@ -1178,7 +1314,7 @@ def _apply_with_plan(
             ),
             suggestion=f"Create a fresh plan by running `.plan to {environment}`",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
     console.print("[green]✅ Plan checksum verified[/green]")
 
@@ -1202,7 +1338,7 @@ def _apply_with_plan(
             ),
             suggestion=f"Create a fresh plan with `.plan to {environment}` using the current Terraform version",
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
     if current_tf_version != "unknown":
         console.print(f"[green]✅ Terraform version verified: {current_tf_version}[/green]")
@@ -1221,13 +1357,14 @@ def _apply_with_plan(
     # would cause path doubling: working_dir/working_dir/filename.
     apply_result = executor.apply(plan_file=Path(plan_file.name))
     if not apply_result.success:
-        env = os.environ.get("TF_BD_ENVIRONMENT", "dev")
         error_msg = format_error_for_comment(
             message="Terraform apply failed. The `terraform apply` command exited with an error after applying the plan.",
             logs_url=_workflow_logs_url(),
-            suggestion=f"Identify the root cause and create a new plan with `.plan to {env}`",
+            suggestion=(
+                f"Identify the root cause and create a new plan with `.plan to {environment}`"
+            ),
         )
-        set_github_output("failure_reason", error_msg)
+        set_github_output(OUTPUT_FAILURE_REASON, error_msg)
         raise typer.Exit(1)
 
 
@@ -1238,20 +1375,24 @@ def validate(
     ] = DEFAULT_CONFIG_PATH,
 ) -> None:
     """Validate the configuration file."""
+    from .config import load_config
+
     console.print(f"🔍 Validating [cyan]{config_path}[/cyan]")
 
     try:
         config = load_config(config_path)
         console.print("[green]✅ Configuration is valid[/green]")
 
-        table = Table(title="Configuration Summary")
-        table.add_column("Property", style="cyan")
-        table.add_column("Value", style="green")
-        table.add_row("Environments", ", ".join(config.environments.keys()))
-        table.add_row("Default", config.default_environment)
-        table.add_row("Production", ", ".join(config.production_environments))
-        table.add_row("Stable Branch", config.stable_branch)
-        console.print(table)
+        _print_table(
+            "Configuration Summary",
+            ("Property", "Value"),
+            [
+                ("Environments", ", ".join(config.environments.keys())),
+                ("Default", config.default_environment),
+                ("Production", ", ".join(config.production_environments)),
+                ("Stable Branch", config.stable_branch),
+            ],
+        )
 
     except FileNotFoundError:
         console.print(f"[red]❌ Config file not found:[/red] {config_path}")
@@ -1264,10 +1405,27 @@ def validate(
 @app.command()
 def schema() -> None:
     """Output the JSON schema for .tf-branch-deploy.yml."""
-    from .config import generate_json_schema
+    schema_text = _packaged_schema()
+    if schema_text is None:
+        from .config import generate_json_schema
+
+        schema_text = json.dumps(generate_json_schema(), indent=2) + "\n"
+    sys.stdout.write(schema_text)
 
-    schema_json = generate_json_schema()
-    console.print_json(data=schema_json)
+
+def _packaged_schema() -> str | None:
+    """Return the schema baked into the wheel at build time, if this install has one.
+
+    Wheels ship tf-branch-deploy.schema.json (kept in sync with the models by
+    tests) as tf_branch_deploy/schema.json; source checkouts fall back to
+    generating it from the models.
+    """
+    from importlib.resources import files
+
+    try:
+        return files("tf_branch_deploy").joinpath(PACKAGED_SCHEMA_FILE).read_text(encoding="utf-8")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 @app.command()
@@ -1277,10 +1435,12 @@ def environments(
     ] = DEFAULT_CONFIG_PATH,
 ) -> None:
     """List available environments (comma-separated for branch-deploy)."""
+    from .config import load_config
+
     try:
         config = load_config(config_path)
-        env_list = ",".join(config.environments.keys())
-        console.print(env_list)
+        env_list = ",".join(config.environments)
+        print(env_list)
     except FileNotFoundError:
         console.print(f"[red]Error:[/red] Config file not found: {config_path}")
         raise typer.Exit(1) from None
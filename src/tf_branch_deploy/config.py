@@ -10,9 +10,9 @@ using Pydantic models. These models serve as:
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 if TYPE_CHECKING:
@@ -81,6 +81,21 @@ class EnvironmentConfig(BaseModel):
     timeout: int = Field(default=3600, ge=60, le=14400)
 
 
+ARG_TYPES = ("init_args", "plan_args", "apply_args")
+
+
+@dataclass(frozen=True)
+class ResolvedEnvironment:
+    """An environment's settings with defaults inheritance already applied."""
+
+    var_files: tuple[str, ...]
+    backend_configs: tuple[str, ...]
+    init_args: tuple[str, ...]
+    plan_args: tuple[str, ...]
+    apply_args: tuple[str, ...]
+    is_production: bool
+
+
 class TerraformBranchDeployConfig(BaseModel):
     """
     Root configuration schema for .tf-branch-deploy.yml.
@@ -136,39 +151,27 @@ class TerraformBranchDeployConfig(BaseModel):
         """Check if an environment is marked as production."""
         return environment in self.production_environments
 
+    def resolve(self, environment: str) -> ResolvedEnvironment:
+        """Resolve every inherited setting for an environment."""
+        env_config = self.get_environment(environment)
+        return ResolvedEnvironment(
+            var_files=self._inherited(env_config, "var_files", "paths"),
+            backend_configs=self._inherited(env_config, "backend_configs", "paths"),
+            init_args=self._inherited(env_config, "init_args", "args"),
+            plan_args=self._inherited(env_config, "plan_args", "args"),
+            apply_args=self._inherited(env_config, "apply_args", "args"),
+            is_production=self.is_production(environment),
+        )
+
     def resolve_var_files(self, environment: str) -> list[str]:
         """Resolve var-files for an environment, applying inheritance."""
         env_config = self.get_environment(environment)
-        result: list[str] = []
-
-        should_inherit = True
-        if env_config.var_files is not None:
-            should_inherit = env_config.var_files.inherit
-
-        if should_inherit and self.defaults and self.defaults.var_files:
-            result.extend(self.defaults.var_files.paths)
-
-        if env_config.var_files:
-            result.extend(env_config.var_files.paths)
-
-        return result
+        return list(self._inherited(env_config, "var_files", "paths"))
 
     def resolve_backend_configs(self, environment: str) -> list[str]:
         """Resolve backend-configs for an environment, applying inheritance."""
         env_config = self.get_environment(environment)
-        result: list[str] = []
-
-        should_inherit = True
-        if env_config.backend_configs is not None:
-            should_inherit = env_config.backend_configs.inherit
-
-        if should_inherit and self.defaults and self.defaults.backend_configs:
-            result.extend(self.defaults.backend_configs.paths)
-
-        if env_config.backend_configs:
-            result.extend(env_config.backend_configs.paths)
-
-        return result
+        return list(self._inherited(env_config, "backend_configs", "paths"))
 
     def resolve_args(self, environment: str, arg_type: str) -> list[str]:
         """
@@ -178,23 +181,19 @@ class TerraformBranchDeployConfig(BaseModel):
             environment: The target environment name
             arg_type: One of 'plan_args', 'apply_args', 'init_args'
         """
-        env_config = self.get_environment(environment)
-        result: list[str] = []
-
-        env_args = getattr(env_config, arg_type, None)
-        default_args = getattr(self.defaults, arg_type, None) if self.defaults else None
+        if arg_type not in ARG_TYPES:
+            raise ValueError(f"Unknown arg type '{arg_type}'. Expected one of: {list(ARG_TYPES)}")
+        return list(self._inherited(self.get_environment(environment), arg_type, "args"))
 
-        should_inherit = True
-        if env_args is not None:
-            should_inherit = env_args.inherit
+    def _inherited(self, env_config: EnvironmentConfig, field: str, items: str) -> tuple[str, ...]:
+        """Apply defaults inheritance for one var-files/backend-configs/*-args block."""
+        env_block = getattr(env_config, field)
+        default_block = getattr(self.defaults, field) if self.defaults else None
+        own: list[str] = getattr(env_block, items) if env_block is not None else []
 
-        if should_inherit and default_args:
-            result.extend(default_args.args)
-
-        if env_args:
-            result.extend(env_args.args)
-
-        return result
+        if default_block is None or (env_block is not None and not env_block.inherit):
+            return tuple(own)
+        return (*getattr(default_block, items), *own)
 
 
 def load_config(config_path: Path) -> TerraformBranchDeployConfig:
@@ -211,11 +210,20 @@ def load_config(config_path: Path) -> TerraformBranchDeployConfig:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config is invalid
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}") from None
+
+    if stat.st_size == 0:
+        raise ValueError(f"Configuration file is empty: {config_path}")
+
+    import yaml  # deferred: only commands that read the config file pay for it
 
-    with open(config_path) as f:
-        raw_config = yaml.safe_load(f)
+    # Same safe loader as yaml.safe_load, but backed by libyaml when available.
+    # Bytes let YAML detect the encoding instead of using the locale's.
+    safe_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    raw_config = yaml.load(config_path.read_bytes(), Loader=safe_loader)  # nosec B506 # nosemgrep: python-unsafe-yaml-load
 
     if not raw_config:
         raise ValueError(f"Configuration file is empty: {config_path}")
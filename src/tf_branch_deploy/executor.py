@@ -9,13 +9,19 @@ from __future__ import annotations
 
 import json
 import os
+import shutil
+import signal
 import subprocess  # nosec B404 - subprocess is required to run terraform
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from rich.console import Console
 
 TF_INPUT_FALSE = "-input=false"
+# Lines of streamed stdout kept on the result; the full output is in the log.
+STREAM_TAIL_LINES = 1000
 GITHUB_TOKEN_ENV_VARS = (
     "GITHUB_TOKEN",
     "GH_TOKEN",
@@ -60,7 +66,24 @@ def _redact_args(args: list[str]) -> str:
     return " ".join(redacted)
 
 
-@dataclass
+def _flag_pairs(flag: str, values: list[str]) -> tuple[str, ...]:
+    """Interleave a flag before each value: ("-var-file", "a", "-var-file", "b")."""
+    return tuple(arg for value in values for arg in (flag, value))
+
+
+def _kill_process_group(proc: subprocess.Popen[str]) -> None:
+    """Kill a command started in its own session along with its children."""
+    if os.name != "posix":
+        proc.kill()
+        return
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        # Already reaped, or the leader exited and the id was reused.
+        proc.kill()
+
+
+@dataclass(slots=True, frozen=True)
 class CommandResult:
     """Result of a command execution."""
 
@@ -74,7 +97,7 @@ class CommandResult:
         return self.exit_code == 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PlanResult(CommandResult):
     """Result of terraform plan."""
 
@@ -83,7 +106,7 @@ class PlanResult(CommandResult):
     checksum: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ApplyResult(CommandResult):
     """Result of terraform apply."""
 
@@ -109,6 +132,26 @@ class TerraformExecutor:
     use_tfcmt: bool = True
     dry_run: bool = False
     timeout: int = 3600
+    # Echo init/plan/apply stdout line by line instead of buffering it all.
+    stream_output: bool = False
+
+    # Result of the tfcmt PATH lookup, filled in on first use.
+    _tfcmt_found: bool | None = field(default=None, init=False, repr=False, compare=False)
+    # Flattened "-var-file X" / "-backend-config Y" pairs, built once.
+    _var_file_args: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _backend_config_args: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # "owner/name" from repo, split once for tfcmt.
+    _repo_owner: str = field(default="", init=False, repr=False, compare=False)
+    _repo_name: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._var_file_args = _flag_pairs("-var-file", self.var_files)
+        self._backend_config_args = _flag_pairs("-backend-config", self.backend_configs)
+        if self.repo:
+            owner, _, name = self.repo.partition("/")
+            if not owner or not name or "/" in name:
+                raise ValueError(f"Repository must be in 'owner/name' form, got: {self.repo!r}")
+            self._repo_owner, self._repo_name = owner, name
 
     def version(self) -> str:
         """Get the installed Terraform version string.
@@ -129,31 +172,29 @@ class TerraformExecutor:
         self,
         args: list[str],
         env: dict[str, str] | None = None,
+        *,
+        stream: bool = False,
     ) -> CommandResult:
-        """Run a command and capture output."""
+        """Run a command and capture output, or stream its stdout when ``stream`` is set."""
         full_env = self._subprocess_env(env)
 
         console.print(f"[dim]$ {_redact_args(args)}[/dim]")
 
+        if stream:
+            return self._stream_command(args, full_env)
+
         try:
             result = subprocess.run(  # nosec B603 B607 - args from validated config, terraform via PATH is expected
                 args,
                 cwd=self.working_directory,
                 capture_output=True,
-                text=True,
+                encoding="utf-8",
+                errors="replace",
                 env=full_env,
                 timeout=self.timeout,
             )
         except subprocess.TimeoutExpired:
-            console.print(
-                f"[red]❌ Command timed out after {self.timeout}s: {_redact_args(args)}[/red]"
-            )
-            return CommandResult(
-                exit_code=124,
-                stdout="",
-                stderr=f"Command timed out after {self.timeout} seconds",
-                command=args,
-            )
+            return self._timed_out(args)
 
         return CommandResult(
             exit_code=result.returncode,
@@ -162,18 +203,88 @@ class TerraformExecutor:
             command=args,
         )
 
+    def _stream_command(self, args: list[str], full_env: dict[str, str] | None) -> CommandResult:
+        """Run a command, echoing stdout as it arrives.
+
+        stderr is drained on a helper thread so neither pipe can fill up and
+        block the child. Only the last STREAM_TAIL_LINES lines of stdout are
+        kept on the result.
+
+        The command runs in its own session so a timeout can kill the whole
+        process group; otherwise provider plugins and other grandchildren
+        would keep the pipes open and outlive the kill.
+        """
+        stdout_tail: deque[str] = deque(maxlen=STREAM_TAIL_LINES)
+        stderr_chunks: list[str] = []
+        timed_out = threading.Event()
+
+        with subprocess.Popen(  # nosec B603 B607 - args from validated config, terraform via PATH is expected
+            args,
+            cwd=self.working_directory,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+            env=full_env,
+            start_new_session=os.name == "posix",
+        ) as proc:
+            stdout_pipe, stderr_pipe = proc.stdout, proc.stderr
+            if stdout_pipe is None or stderr_pipe is None:
+                raise RuntimeError("Command output pipes were not opened")
+
+            def kill_on_timeout() -> None:
+                timed_out.set()
+                _kill_process_group(proc)
+
+            timer = threading.Timer(self.timeout, kill_on_timeout)
+            stderr_reader = threading.Thread(
+                target=lambda: stderr_chunks.append(stderr_pipe.read()), daemon=True
+            )
+            timer.start()
+            stderr_reader.start()
+            try:
+                for line in stdout_pipe:
+                    console.out(line, end="", highlight=False)
+                    stdout_tail.append(line)
+                stderr_reader.join()
+                returncode = proc.wait()
+            except BaseException:
+                # Detached from our session, the group would not see Ctrl-C.
+                _kill_process_group(proc)
+                raise
+            finally:
+                timer.cancel()
+
+        if timed_out.is_set():
+            return self._timed_out(args)
+
+        return CommandResult(
+            exit_code=returncode,
+            stdout="".join(stdout_tail),
+            stderr="".join(stderr_chunks),
+            command=args,
+        )
+
+    def _timed_out(self, args: list[str]) -> CommandResult:
+        """Report a command killed for exceeding the environment timeout."""
+        console.print(
+            f"[red]❌ Command timed out after {self.timeout}s: {_redact_args(args)}[/red]"
+        )
+        return CommandResult(
+            exit_code=124,
+            stdout="",
+            stderr=f"Command timed out after {self.timeout} seconds",
+            command=args,
+        )
+
     def init(self) -> CommandResult:
         """Run terraform init."""
         console.print("\n[bold blue]📦 Terraform Init[/bold blue]")
 
-        args = ["terraform", "init", TF_INPUT_FALSE]
-
-        for backend in self.backend_configs:
-            args.extend(["-backend-config", backend])
+        args = ["terraform", "init", TF_INPUT_FALSE, *self._backend_config_args, *self.init_args]
 
-        args.extend(self.init_args)
-
-        result = self._run_command(args)
+        result = self._run_command(args, stream=self.stream_output)
 
         if result.success:
             console.print("[green]✅ Init successful[/green]")
@@ -202,18 +313,21 @@ class TerraformExecutor:
         # checks the correct location (terraform writes relative to cwd).
         resolved_out = out_file if out_file.is_absolute() else self.working_directory / out_file
 
-        args = ["terraform", "plan", TF_INPUT_FALSE, "-detailed-exitcode"]
-
-        for var_file in self.var_files:
-            args.extend(["-var-file", var_file])
-
-        args.extend(["-out", str(out_file)])
-        args.extend(self.plan_args)
+        args = [
+            "terraform",
+            "plan",
+            TF_INPUT_FALSE,
+            "-detailed-exitcode",
+            *self._var_file_args,
+            "-out",
+            str(out_file),
+            *self.plan_args,
+        ]
 
         if self.use_tfcmt and self._tfcmt_available():
             result = self._run_with_tfcmt("plan", args)
         else:
-            result = self._run_command(args)
+            result = self._run_command(args, stream=self.stream_output)
 
         # Terraform plan exit codes:
         # 0 = Success, no changes
@@ -231,7 +345,8 @@ class TerraformExecutor:
 
         # Calculate checksum using resolved path
         checksum = None
-        if resolved_out.exists():
+        plan_exists = resolved_out.exists()
+        if plan_exists:
             from .artifacts import calculate_checksum
 
             checksum = calculate_checksum(resolved_out)
@@ -242,7 +357,7 @@ class TerraformExecutor:
             stderr=result.stderr,
             command=result.command,
             has_changes=has_changes,
-            plan_file=resolved_out if resolved_out.exists() else None,
+            plan_file=resolved_out if plan_exists else None,
             checksum=checksum,
         )
 
@@ -268,14 +383,13 @@ class TerraformExecutor:
         if plan_arg:
             args.append(plan_arg)
         else:
-            for var_file in self.var_files:
-                args.extend(["-var-file", var_file])
+            args.extend(self._var_file_args)
             args.extend(self.apply_args)
 
         if self.use_tfcmt and self._tfcmt_available():
             result = self._run_with_tfcmt("apply", args)
         else:
-            result = self._run_command(args)
+            result = self._run_command(args, stream=self.stream_output)
 
         if result.success:
             console.print("[green]✅ Apply successful[/green]")
@@ -330,24 +444,24 @@ class TerraformExecutor:
         )
 
     def _tfcmt_available(self) -> bool:
-        """Check if tfcmt is installed."""
-        try:
-            result = subprocess.run(  # nosec B603 B607 - tfcmt version check
-                ["tfcmt", "--version"],
-                capture_output=True,
-                text=True,
-                env=self._subprocess_env(),
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+        """Check if tfcmt is installed (a PATH lookup, done once per executor)."""
+        if self._tfcmt_found is None:
+            self._tfcmt_found = shutil.which("tfcmt") is not None
+        return self._tfcmt_found
 
     @staticmethod
-    def _subprocess_env(env: dict[str, str] | None = None) -> dict[str, str]:
-        """Build a subprocess environment that does not leak GitHub tokens to Terraform."""
-        full_env = os.environ.copy()
-        for name in GITHUB_TOKEN_ENV_VARS:
-            full_env.pop(name, None)
+    def _subprocess_env(env: dict[str, str] | None = None) -> dict[str, str] | None:
+        """Build a subprocess environment that does not leak GitHub tokens to Terraform.
+
+        Returns None (inherit the parent environment as-is) when there are no
+        overrides and no tokens to strip, which avoids copying os.environ.
+        """
+        parent_env = os.environ
+        if not env and not any(name in parent_env for name in GITHUB_TOKEN_ENV_VARS):
+            return None
+        full_env = {
+            key: value for key, value in parent_env.items() if key not in GITHUB_TOKEN_ENV_VARS
+        }
         if env:
             full_env.update(env)
         return full_env
@@ -355,7 +469,7 @@ class TerraformExecutor:
     def _run_with_tfcmt(self, operation: str, tf_args: list[str]) -> CommandResult:
         """Run terraform command wrapped with tfcmt for PR comments."""
         if not self.github_token or not self.repo or not self.pr_number:
-            return self._run_command(tf_args)
+            return self._run_command(tf_args, stream=self.stream_output)
 
         scrubbed_tf_args = ["env"]
         for name in GITHUB_TOKEN_ENV_VARS:
@@ -365,9 +479,9 @@ class TerraformExecutor:
         args = [
             "tfcmt",
             "-owner",
-            self.repo.split("/")[0],
+            self._repo_owner,
             "-repo",
-            self.repo.split("/")[1],
+            self._repo_name,
             "-pr",
             str(self.pr_number),
             operation,
@@ -376,4 +490,4 @@ class TerraformExecutor:
         ]
 
         env = {"GITHUB_TOKEN": self.github_token}
-        return self._run_command(args, env=env)
+        return self._run_command(args, env=env, stream=self.stream_output)
@@ -13,6 +13,7 @@ from __future__ import annotations
 import json
 import os
 import subprocess  # nosec B404
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
@@ -20,33 +21,48 @@ from rich.console import Console
 
 console = Console()
 
+_SUCCESS_HEADER = "### Deployment Results ✅"
+_FAILURE_HEADER = "### ⚠️ Cannot proceed with deployment"
+_DEFAULT_FAILURE_MESSAGE = (
+    "An unexpected error occurred. Please review the workflow logs for details."
+)
+_RESULT_COMMENT_TEMPLATE = (
+    "{header}\n\n{msg}\n\n"
+    "<details><summary>Details</summary>\n\n"
+    "```json\n{metadata}\n```\n\n"
+    "</details>"
+)
+
 
 def branch_deploy_lock_ref(environment: str) -> str:
     """Return the lock ref name used by github/branch-deploy."""
     return f"{environment.replace(' ', '-')}-branch-deploy-lock"
 
 
-def github_cli_env(token: str | None) -> dict[str, str]:
+def github_cli_env(token: str | None) -> dict[str, str] | None:
     """Build environment variables required by gh across GitHub hosts.
 
     Supports:
     - github.com (uses GITHUB_TOKEN)
     - ghe.com subdomains (uses GH_TOKEN)
     - Self-hosted GHE Server (uses GH_ENTERPRISE_TOKEN + GH_HOST)
+
+    Returns None when nothing needs overriding, so gh simply inherits the
+    parent environment.
     """
-    env = os.environ.copy()
+    overrides: dict[str, str] = {}
     if token:
-        env["GITHUB_TOKEN"] = token  # github.com
-        env["GH_TOKEN"] = token  # ghe.com
-        env["GH_ENTERPRISE_TOKEN"] = token  # Self-hosted GHE
+        overrides["GITHUB_TOKEN"] = token  # github.com
+        overrides["GH_TOKEN"] = token  # ghe.com
+        overrides["GH_ENTERPRISE_TOKEN"] = token  # Self-hosted GHE
 
-    host = _github_enterprise_host(env)
+    host = _github_enterprise_host(os.environ)
     if host:
-        env["GH_HOST"] = host
-    return env
+        overrides["GH_HOST"] = host
+    return {**os.environ, **overrides} if overrides else None
 
 
-def _github_enterprise_host(env: dict[str, str]) -> str | None:
+def _github_enterprise_host(env: Mapping[str, str]) -> str | None:
     """Return the gh host for GitHub Enterprise Server, if configured."""
     server_url = env.get("GITHUB_SERVER_URL")
     if not server_url:
@@ -142,7 +158,7 @@ class LifecycleManager:
     def format_result_comment(
         self,
         status: str,
-        env_vars: dict[str, str],
+        env_vars: Mapping[str, str],
         failure_reason: str | None = None,
     ) -> str:
         """Format the result comment body."""
@@ -154,20 +170,17 @@ class LifecycleManager:
         deploy_type = "**noop** deployed" if noop else "deployed"
 
         if status == "success":
-            header = "### Deployment Results ✅"
+            header = _SUCCESS_HEADER
             msg = f"**{actor}** successfully {deploy_type} branch `{ref}` to **{env}**"
         else:
-            header = "### ⚠️ Cannot proceed with deployment"
-            msg = (
-                failure_reason
-                or "An unexpected error occurred. Please review the workflow logs for details."
-            )
+            header = _FAILURE_HEADER
+            msg = failure_reason or _DEFAULT_FAILURE_MESSAGE
 
-        metadata = self._generate_metadata(env_vars)
+        metadata = json.dumps(self._generate_metadata(env_vars), indent=2)
 
-        return f"{header}\n\n{msg}\n\n<details><summary>Details</summary>\n\n```json\n{json.dumps(metadata, indent=2)}\n```\n\n</details>"
+        return _RESULT_COMMENT_TEMPLATE.format(header=header, msg=msg, metadata=metadata)
 
-    def _generate_metadata(self, env_vars: dict[str, str]) -> dict[str, Any]:
+    def _generate_metadata(self, env_vars: Mapping[str, str]) -> dict[str, Any]:
         """Generate metadata JSON for the comment."""
         return {
             "type": env_vars.get("TF_BD_TYPE"),
@@ -270,7 +283,7 @@ class LifecycleManager:
 
         return self._handle_gh_result(cmd, result, capture_output, raise_on_error)
 
-    def _github_cli_env(self) -> dict[str, str]:
+    def _github_cli_env(self) -> dict[str, str] | None:
         """Build environment variables required by gh across GitHub hosts."""
         return github_cli_env(self.github_token)
 
@@ -0,0 +1,17 @@
+"""Shared fixtures for contract tests."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+
+ACTION_PATH = Path(__file__).parent.parent.parent / "action.yml"
+
+
+@pytest.fixture(scope="session")
+def our_action() -> dict[str, Any]:
+    """Load our action.yml once per test session."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(ACTION_PATH) as f:
+        return yaml.load(f, Loader=loader)  # nosemgrep: python-unsafe-yaml-load
@@ -4,18 +4,15 @@ from pathlib import Path
 from typing import Any
 
 import pytest
-import yaml
 
 
-@pytest.fixture
-def action() -> dict[str, Any]:
-    """Load action.yml."""
-    action_path = Path(__file__).parent.parent.parent / "action.yml"
-    with open(action_path) as f:
-        return yaml.safe_load(f)
+@pytest.fixture(scope="session")
+def action(our_action: dict[str, Any]) -> dict[str, Any]:
+    """The parsed action.yml, shared with the other contract tests."""
+    return our_action
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def action_text() -> str:
     """Load action.yml as text so comments remain testable."""
     action_path = Path(__file__).parent.parent.parent / "action.yml"
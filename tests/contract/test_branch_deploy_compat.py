@@ -13,6 +13,9 @@ import pytest
 import yaml
 
 
+# libyaml-backed safe loader when PyYAML was built with it.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 BRANCH_DEPLOY_VERSION = "v11.1.5"
 BRANCH_DEPLOY_SHA = "de4d10ee17c3117a2076aff489ba03fadf225f35"
 
@@ -96,15 +99,7 @@ DIRECT_PASSTHROUGH_INPUTS = set(INPUT_MAPPINGS) - {
 }
 
 
-@pytest.fixture
-def our_action() -> dict[str, Any]:
-    """Load our action.yml."""
-    action_path = Path(__file__).parent.parent.parent / "action.yml"
-    with open(action_path) as f:
-        return yaml.safe_load(f)
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def branch_deploy_action() -> dict[str, Any]:
     """Load the pinned branch-deploy input snapshot."""
     fixture_path = (
@@ -113,7 +108,7 @@ def branch_deploy_action() -> dict[str, Any]:
         / f"branch-deploy-{BRANCH_DEPLOY_VERSION}-inputs.yml"
     )
     with open(fixture_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_SafeLoader)  # nosemgrep: python-unsafe-yaml-load
 
 
 def normalize_input_name(name: str) -> str:
@@ -78,17 +78,17 @@ class TestArtifactNaming:
         assert "prod" in name
         assert name.endswith(".tfplan")
 
-    def test_artifact_name_various_environments(self) -> None:
-        """Test artifact naming with various environment names."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("env", "sha", "expected"),
+        [
             ("dev", "abc12345", "tfplan-dev-abc12345.tfplan"),
             ("prod", "def67890abc12345", "tfplan-prod-def67890.tfplan"),
             ("staging", "1234abcd", "tfplan-staging-1234abcd.tfplan"),
-        ]
-
-        for env, sha, expected in test_cases:
-            result = generate_artifact_name(env, sha)
-            assert result == expected, f"Failed for {env}, {sha}"
+        ],
+    )
+    def test_artifact_name_various_environments(self, env: str, sha: str, expected: str) -> None:
+        """Test artifact naming with various environment names."""
+        assert generate_artifact_name(env, sha) == expected
 
     def test_artifact_name_is_valid_filename(self) -> None:
         """Artifact name should be a valid filename."""
@@ -16,6 +16,7 @@ from tf_branch_deploy.cli import (
     DEFAULT_CONFIG_PATH,
     _ArgTokenizer,
     _apply_with_plan,
+    _batched_github_outputs,
     _handle_apply,
     _handle_plan,
     _load_and_validate_config,
@@ -24,7 +25,9 @@ from tf_branch_deploy.cli import (
     _validate_config_args,
     _validate_extra_args,
     app,
+    format_error_for_comment,
     set_github_output,
+    set_github_output_json,
 )
 
 runner = CliRunner()
@@ -71,6 +74,65 @@ class TestConstants:
         assert str(DEFAULT_CONFIG_PATH) == ".tf-branch-deploy.yml"
 
 
+class TestImportCost:
+    """The CLI module defers its heavy dependencies to the commands that need them."""
+
+    def test_import_does_not_load_rich_pydantic_or_yaml(self) -> None:
+        """Importing the CLI in a fresh interpreter pulls in none of the heavy packages."""
+        import os
+        import subprocess
+        import sys
+
+        src = Path(__file__).resolve().parents[1] / "src"
+        probe = (
+            "import sys, tf_branch_deploy.cli; "
+            "print(sorted(m for m in ('rich', 'pydantic', 'yaml') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src)},
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_environments_command_skips_execution_modules(self, tmp_path: Path) -> None:
+        """Listing environments never loads the executor, lifecycle or Rich layout code."""
+        import os
+        import subprocess
+        import sys
+
+        config_file = tmp_path / ".tf-branch-deploy.yml"
+        config_file.write_text(
+            "default-environment: dev\nproduction-environments: [dev]\nenvironments: {dev: {}}"
+        )
+        src = Path(__file__).resolve().parents[1] / "src"
+        heavy = (
+            "tf_branch_deploy.executor",
+            "tf_branch_deploy.lifecycle",
+            "tf_branch_deploy.artifacts",
+            "rich.panel",
+            "rich.table",
+        )
+        probe = (
+            "import sys\n"
+            "from tf_branch_deploy.cli import app\n"
+            f"app(['environments', '--config', {str(config_file)!r}], standalone_mode=False)\n"
+            f"print(sorted(m for m in {heavy!r} if m in sys.modules))\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src)},
+        )
+
+        assert result.stdout.splitlines() == ["dev", "[]"]
+
+
 class TestGithubOutput:
     """Tests for GitHub Actions output handling."""
 
@@ -102,38 +164,135 @@ class TestGithubOutput:
         assert "\ntrue\n" in text
         assert text.count("has_changes=") == 0
 
+    def test_each_output_gets_its_own_delimiter(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Delimiters never repeat within a run, even for the same output name."""
+        output_file = tmp_path / "github-output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+
+        set_github_output("failure_reason", "first")
+        set_github_output("failure_reason", "second")
+        headers = [
+            line for line in output_file.read_text(encoding="utf-8").splitlines() if "<<" in line
+        ]
 
-class TestParseExtraArgs:
-    """Tests for _parse_extra_args function."""
+        assert len(headers) == 2
+        assert headers[0] != headers[1]
+
+    @pytest.mark.parametrize(
+        ("value", "expected"), [([], "[]"), (["a.tfvars", "b.tfvars"], '["a.tfvars", "b.tfvars"]')]
+    )
+    def test_json_outputs_are_encoded_on_write(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        value: list[str],
+        expected: str,
+    ) -> None:
+        """List outputs are written as JSON, including the empty list."""
+        output_file = tmp_path / "github-output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
 
-    def test_simple_args(self) -> None:
-        result = _parse_extra_args("-refresh=false -parallelism=5")
-        assert result == ["-refresh=false", "-parallelism=5"]
+        set_github_output_json("var_files", value)
 
-    def test_single_quoted_value(self) -> None:
-        result = _parse_extra_args("-var='msg=hello world'")
-        assert result == ["-var=msg=hello world"]
+        assert f"\n{expected}\n" in output_file.read_text(encoding="utf-8")
 
-    def test_double_quoted_value(self) -> None:
-        result = _parse_extra_args('-var="key=value"')
-        assert result == ["-var=key=value"]
+    def test_batched_outputs_are_flushed_in_one_append(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Inside a batch nothing is written until the batch closes."""
+        output_file = tmp_path / "github-output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
 
-    def test_bracket_with_quotes(self) -> None:
-        result = _parse_extra_args('-target=module.test["key"]')
-        assert result == ['-target=module.test["key"]']
+        with _batched_github_outputs():
+            set_github_output("has_changes", "true")
+            set_github_output_json("var_files", ["a.tfvars"])
+            assert not output_file.exists()
 
-    def test_mixed_args(self) -> None:
-        result = _parse_extra_args("-var='x=1' -target=module.foo -refresh=false")
-        assert result == ["-var=x=1", "-target=module.foo", "-refresh=false"]
+        text = output_file.read_text(encoding="utf-8")
+        assert text.index("has_changes<<") < text.index("var_files<<")
+        assert '\n["a.tfvars"]\n' in text
 
-    def test_empty_string(self) -> None:
-        result = _parse_extra_args("")
-        assert result == []
+    def test_batched_outputs_are_flushed_when_the_command_fails(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """failure_reason must reach GITHUB_OUTPUT even though the command exits 1."""
+        output_file = tmp_path / "github-output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+
+        with pytest.raises(typer.Exit), _batched_github_outputs():
+            set_github_output("failure_reason", "boom")
+            raise typer.Exit(1)
+
+        assert "\nboom\n" in output_file.read_text(encoding="utf-8")
+
+    def test_output_preview_is_plain_stderr_breadcrumb(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """The log preview bypasses Rich markup and never spans multiple lines."""
+        monkeypatch.delenv("GITHUB_OUTPUT", raising=False)
+
+        set_github_output("failure_reason", "[red]first[/red]\nsecond")
+        captured = capsys.readouterr()
+
+        assert captured.out == ""
+        assert captured.err == "Output: failure_reason=[red]first[/red]\\nsecond\n"
 
-    def test_spaces_in_value(self) -> None:
-        """Test preserving spaces within quoted values."""
-        result = _parse_extra_args("-var='message=hello world foo bar'")
-        assert result == ["-var=message=hello world foo bar"]
+
+class TestFormatErrorForComment:
+    """Tests for failure comment formatting."""
+
+    def test_message_only(self) -> None:
+        """Without optional parts the message is returned unchanged."""
+        assert format_error_for_comment("Plan failed.") == "Plan failed."
+
+    def test_all_parts_separated_by_blank_lines(self) -> None:
+        """Details, logs link and suggestion follow the message in that order."""
+        text = format_error_for_comment(
+            "Plan failed.",
+            details="- detail",
+            suggestion="Try again",
+            logs_url="https://example.test/run",
+        )
+
+        assert text == (
+            "Plan failed.\n\n- detail\n\n"
+            "📋 [View workflow logs](https://example.test/run)\n\n"
+            "> Try again"
+        )
+
+
+class TestParseExtraArgs:
+    """Tests for _parse_extra_args function."""
+
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param(
+                "-refresh=false -parallelism=5", ["-refresh=false", "-parallelism=5"], id="simple"
+            ),
+            pytest.param("-var='msg=hello world'", ["-var=msg=hello world"], id="single-quoted"),
+            pytest.param('-var="key=value"', ["-var=key=value"], id="double-quoted"),
+            pytest.param(
+                '-target=module.test["key"]', ['-target=module.test["key"]'], id="bracket-quotes"
+            ),
+            pytest.param(
+                "-var='x=1' -target=module.foo -refresh=false",
+                ["-var=x=1", "-target=module.foo", "-refresh=false"],
+                id="mixed",
+            ),
+            pytest.param("", [], id="empty"),
+            pytest.param(
+                "-var='message=hello world foo bar'",
+                ["-var=message=hello world foo bar"],
+                id="spaces-in-value",
+            ),
+        ],
+    )
+    def test_parse(self, raw: str, expected: list[str]) -> None:
+        """Unquoted spaces split args and outer shell quotes are stripped."""
+        assert _parse_extra_args(raw) == expected
 
 
 class TestValidateExtraArgs:
@@ -338,25 +497,22 @@ class TestPlanArtifactName:
 class TestStripShellQuotes:
     """Tests for _strip_shell_quotes function."""
 
-    def test_single_quotes(self) -> None:
-        """Strip single quotes from value."""
-        assert _strip_shell_quotes("-var='value'") == "-var=value"
-
-    def test_double_quotes(self) -> None:
-        """Strip double quotes from value."""
-        assert _strip_shell_quotes('-var="value"') == "-var=value"
-
-    def test_no_quotes(self) -> None:
-        """Leave unquoted values unchanged."""
-        assert _strip_shell_quotes("-var=value") == "-var=value"
-
-    def test_no_equals(self) -> None:
-        """Arguments without = are left unchanged."""
-        assert _strip_shell_quotes("-help") == "-help"
-
-    def test_preserve_internal_quotes(self) -> None:
-        """Internal quotes in terraform targets are preserved."""
-        assert _strip_shell_quotes('-target=module["key"]') == '-target=module["key"]'
+    @pytest.mark.parametrize(
+        ("arg", "expected"),
+        [
+            pytest.param("-var='value'", "-var=value", id="single-quotes"),
+            pytest.param('-var="value"', "-var=value", id="double-quotes"),
+            pytest.param("-var=value", "-var=value", id="no-quotes"),
+            pytest.param("-help", "-help", id="no-equals"),
+            pytest.param('-target=module["key"]', '-target=module["key"]', id="internal-quotes"),
+            pytest.param("-var='x=1\"", "-var='x=1\"", id="mismatched-quotes"),
+            pytest.param("-var='", "-var='", id="lone-quote"),
+            pytest.param("-var=''", "-var=", id="empty-quoted"),
+        ],
+    )
+    def test_strip(self, arg: str, expected: str) -> None:
+        """Only a matching pair of outer quotes around the value is stripped."""
+        assert _strip_shell_quotes(arg) == expected
 
 
 class TestArgTokenizer:
@@ -438,11 +594,26 @@ class TestValidateCommand:
         """)
         )
 
-        result = runner.invoke(app, ["validate", "--config", str(config_file)])
+        result = runner.invoke(
+            app, ["validate", "--config", str(config_file)], catch_exceptions=False
+        )
 
         assert result.exit_code == 0
         assert "valid" in result.stdout.lower()
 
+    def test_validate_summary_is_plain_outside_a_terminal(self, tmp_path: Path) -> None:
+        """CI logs get key/value lines instead of a box-drawn table."""
+        config_file = tmp_path / ".tf-branch-deploy.yml"
+        config_file.write_text(
+            "default-environment: dev\nproduction-environments: [dev]\nenvironments: {dev: {}}"
+        )
+
+        result = runner.invoke(app, ["validate", "--config", str(config_file)])
+
+        assert result.exit_code == 0
+        assert "Configuration Summary\n  Environments: dev\n  Default: dev\n" in result.stdout
+        assert "┃" not in result.stdout and "│" not in result.stdout
+
     def test_validate_missing_config(self, tmp_path: Path) -> None:
         """Test error when config file doesn't exist."""
         result = runner.invoke(app, ["validate", "--config", str(tmp_path / "missing.yml")])
@@ -483,7 +654,9 @@ class TestEnvironmentsCommand:
         """)
         )
 
-        result = runner.invoke(app, ["environments", "--config", str(config_file)])
+        result = runner.invoke(
+            app, ["environments", "--config", str(config_file)], catch_exceptions=False
+        )
 
         assert result.exit_code == 0
         # Should contain all environments
@@ -491,62 +664,96 @@ class TestEnvironmentsCommand:
         assert "staging" in result.stdout
         assert "prod" in result.stdout
 
+    def test_invalid_config_is_rejected(self, tmp_path: Path) -> None:
+        """Environment names are not listed when the config fails validation."""
+        config_file = tmp_path / ".tf-branch-deploy.yml"
+        config_file.write_text(
+            "default-environment: dev\nproduction-environments: [dev]\nenvironments: {dev: {}, qa: {timeout: 5}}"
+        )
+
+        result = runner.invoke(app, ["environments", "--config", str(config_file)])
+
+        assert result.exit_code == 1
+        assert "Failed to load config" in result.stdout
+
 
 class TestSchemaCommand:
     """Tests for the schema command."""
 
     def test_outputs_valid_json(self) -> None:
         """Test that schema command outputs valid JSON."""
-        result = runner.invoke(app, ["schema"])
+        result = runner.invoke(app, ["schema"], catch_exceptions=False)
 
         assert result.exit_code == 0
         # Output should be parseable JSON
         schema = json.loads(result.stdout)
         assert "properties" in schema
 
+    def test_generated_fallback_matches_committed_schema_file(self) -> None:
+        """Source checkouts print exactly what wheels ship as schema.json."""
+        from unittest.mock import patch
+
+        committed = (Path(__file__).parent.parent / "tf-branch-deploy.schema.json").read_text()
+
+        with patch("tf_branch_deploy.cli._packaged_schema", return_value=None):
+            result = runner.invoke(app, ["schema"])
+
+        assert result.stdout == committed
+
+    def test_prefers_packaged_schema(self) -> None:
+        """An installed schema.json is printed without regenerating from the models."""
+        from unittest.mock import patch
+
+        with (
+            patch("tf_branch_deploy.cli._packaged_schema", return_value='{"packaged": true}\n'),
+            patch("tf_branch_deploy.config.generate_json_schema") as mock_generate,
+        ):
+            result = runner.invoke(app, ["schema"])
+
+        assert result.stdout == '{"packaged": true}\n'
+        mock_generate.assert_not_called()
+
 
 class TestGetConfigCommand:
     """Tests for get-config command."""
 
-    def test_get_default_environment(self, tmp_path: Path) -> None:
-        """Test getting default environment."""
+    CONFIG = (
+        "default-environment: dev\n"
+        "production-environments: [prod, stage]\n"
+        "environments: {dev: {}, prod: {}, stage: {}}"
+    )
+
+    @pytest.mark.parametrize(
+        ("key", "exit_code", "expected"),
+        [
+            pytest.param("default-environment", 0, "dev", id="default-environment"),
+            pytest.param("production-environments", 0, "prod,stage", id="production-environments"),
+            pytest.param("invalid-key", 1, "Unsupported key", id="invalid-key"),
+        ],
+    )
+    def test_get_key(self, tmp_path: Path, key: str, exit_code: int, expected: str) -> None:
+        """Each supported key prints its value; unknown keys are rejected."""
         config_file = tmp_path / ".tf-branch-deploy.yml"
-        config_file.write_text(
-            "default-environment: dev\nproduction-environments: [prod]\nenvironments: {dev: {}, prod: {}}"
-        )
+        config_file.write_text(self.CONFIG)
 
-        result = runner.invoke(
-            app, ["get-config", "default-environment", "--config", str(config_file)]
-        )
+        result = runner.invoke(app, ["get-config", key, "--config", str(config_file)])
 
-        assert result.exit_code == 0
-        assert "dev" in result.stdout
+        assert result.exit_code == exit_code
+        assert expected in result.stdout
 
-    def test_get_production_environments(self, tmp_path: Path) -> None:
-        """Test getting production environments."""
+    def test_invalid_config_is_rejected(self, tmp_path: Path) -> None:
+        """A readable key is not printed when the rest of the config fails validation."""
         config_file = tmp_path / ".tf-branch-deploy.yml"
         config_file.write_text(
-            "default-environment: dev\nproduction-environments: [prod, stage]\nenvironments: {dev: {}, prod: {}, stage: {}}"
+            "default-environment: dev\nproduction-environments: [dev]\nenvironments: {dev: {timeout: 5}}"
         )
 
         result = runner.invoke(
-            app, ["get-config", "production-environments", "--config", str(config_file)]
-        )
-
-        assert result.exit_code == 0
-        assert "prod,stage" in result.stdout
-
-    def test_invalid_key(self, tmp_path: Path) -> None:
-        """Test getting invalid key."""
-        config_file = tmp_path / ".tf-branch-deploy.yml"
-        config_file.write_text(
-            "default-environment: dev\nproduction-environments: [prod]\nenvironments: {dev: {}, prod: {}}"
+            app, ["get-config", "default-environment", "--config", str(config_file)]
         )
 
-        result = runner.invoke(app, ["get-config", "invalid-key", "--config", str(config_file)])
-
         assert result.exit_code == 1
-        assert "Unsupported key" in result.stdout
+        assert "Invalid config" in result.stdout
 
 
 class TestCompleteLifecycleCommand:
@@ -618,6 +825,44 @@ class TestCompleteLifecycleCommand:
         mock_manager.post_result_comment.assert_called()
         mock_manager.remove_non_sticky_lock.assert_called_with("dev")
 
+    def test_independent_api_calls_run_concurrently(self, monkeypatch) -> None:
+        """Status, reactions and comment overlap; the lock is released afterwards."""
+        import threading
+        from unittest.mock import MagicMock, patch
+
+        monkeypatch.setenv("GITHUB_REPOSITORY", "org/repo")
+        monkeypatch.setenv("GITHUB_TOKEN", "token")
+        monkeypatch.setenv("TF_BD_DEPLOYMENT_ID", "123")
+        monkeypatch.setenv("TF_BD_ENVIRONMENT", "dev")
+        monkeypatch.setenv("TF_BD_COMMENT_ID", "456")
+        monkeypatch.setenv("TF_BD_INITIAL_REACTION_ID", "789")
+        monkeypatch.setenv("TF_BD_PR_NUMBER", "10")
+
+        # Every call waits for the other three: this only passes if they overlap.
+        barrier = threading.Barrier(4, timeout=5)
+        events: list[str] = []
+
+        def api_call(*_args: str) -> None:
+            barrier.wait()
+            events.append("api")
+
+        with patch("tf_branch_deploy.lifecycle.LifecycleManager") as mock_manager_cls:
+            mock_manager = MagicMock()
+            mock_manager_cls.return_value = mock_manager
+            for name in (
+                "update_deployment_status",
+                "remove_reaction",
+                "add_reaction",
+                "post_result_comment",
+            ):
+                getattr(mock_manager, name).side_effect = api_call
+            mock_manager.remove_non_sticky_lock.side_effect = lambda _env: events.append("lock")
+
+            result = runner.invoke(app, ["complete-lifecycle", "--status", "success"])
+
+        assert result.exit_code == 0, result.stdout
+        assert events == ["api", "api", "api", "api", "lock"]
+
 
 class TestHandlePlan:
     """Tests for plan output and metadata handling."""
@@ -933,6 +1178,36 @@ class TestApplyWithPlanIntegrity:
         # apply() must be called with just the filename (executor resolves from working_dir)
         mock_executor.apply.assert_called_once_with(plan_file=Path(plan_file.name))
 
+    def test_apply_failure_suggests_the_applied_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The re-plan hint names the environment being applied, not TF_BD_ENVIRONMENT."""
+        from unittest.mock import MagicMock
+
+        plan_file = tmp_path / "tfplan-int-abc12345.tfplan"
+        plan_file.write_bytes(b"valid plan content")
+        _save_plan_metadata(plan_file)
+        output_file = tmp_path / "github_output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+        monkeypatch.setenv("TF_BD_ENVIRONMENT", "prod")
+
+        mock_executor = MagicMock()
+        mock_executor.apply.return_value = MagicMock(success=False)
+        mock_executor.version.return_value = "1.9.8"
+
+        with pytest.raises(typer.Exit):
+            _apply_with_plan(
+                mock_executor,
+                plan_file,
+                "int",
+                "abc12345ff",
+                expected_params_hash="no-args",
+            )
+
+        text = output_file.read_text(encoding="utf-8")
+        assert "`.plan to int`" in text
+        assert "prod" not in text
+
     def test_apply_surfaces_saved_plan_args_and_hash(
         self,
         tmp_path: Path,
@@ -1203,6 +1478,40 @@ class TestExecuteArgumentSemantics:
         assert result.exit_code == 1
         mock_init.assert_not_called()
 
+    def test_malformed_repository_sets_failure_reason(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A GITHUB_REPOSITORY that is not owner/name is reported, not raised."""
+        from unittest.mock import patch
+
+        config_file = self._write_config(tmp_path)
+        output_file = tmp_path / "github_output"
+        monkeypatch.setenv("GITHUB_OUTPUT", str(output_file))
+        monkeypatch.setenv("GITHUB_REPOSITORY", "org")
+
+        with patch("tf_branch_deploy.executor.TerraformExecutor.init") as mock_init:
+            result = runner.invoke(
+                app,
+                [
+                    "execute",
+                    "--environment",
+                    "int",
+                    "--operation",
+                    "plan",
+                    "--sha",
+                    "abc12345ff",
+                    "--config",
+                    str(config_file),
+                ],
+            )
+
+        assert result.exit_code == 1
+        assert result.exception is None or isinstance(result.exception, SystemExit)
+        mock_init.assert_not_called()
+        text = output_file.read_text(encoding="utf-8")
+        assert "failure_reason<<" in text
+        assert "owner/name" in text
+
     def test_apply_extra_args_fail_before_terraform_init(self, tmp_path: Path) -> None:
         from unittest.mock import patch
 
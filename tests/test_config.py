@@ -80,6 +80,28 @@ class TestTerraformBranchDeployConfig:
         assert config.is_production("prod")
         assert config.is_production("prod-eu")
 
+    def test_is_production_follows_copies_and_mutation(self) -> None:
+        """Production detection reads the field, not state captured at validation."""
+        config = TerraformBranchDeployConfig.model_validate(
+            {
+                "default-environment": "dev",
+                "production-environments": ["prod"],
+                "environments": {"dev": {}, "prod": {}},
+            }
+        )
+
+        copied = config.model_copy(update={"production_environments": ["dev", "prod"]})
+        constructed = TerraformBranchDeployConfig.model_construct(
+            default_environment="dev",
+            production_environments=["prod"],
+            environments={"dev": {}, "prod": {}},
+        )
+        config.production_environments.append("dev")
+
+        assert copied.is_production("dev")
+        assert constructed.is_production("prod")
+        assert config.is_production("dev")
+
     def test_var_files_inheritance(self) -> None:
         """Test that var-files properly inherit from defaults."""
         config = TerraformBranchDeployConfig.model_validate(
@@ -124,6 +146,63 @@ class TestTerraformBranchDeployConfig:
         prod_plan_args = config.resolve_args("prod", "plan_args")
         assert prod_plan_args == ["-parallelism=30"]
 
+    def test_resolve_args_rejects_unknown_arg_type(self) -> None:
+        """Only the three *-args blocks can be resolved as arguments."""
+        config = TerraformBranchDeployConfig.model_validate(
+            {
+                "default-environment": "dev",
+                "production-environments": ["dev"],
+                "environments": {"dev": {}},
+            }
+        )
+
+        for arg_type in ("var_files", "is_production", "plan-args"):
+            with pytest.raises(ValueError, match="Unknown arg type"):
+                config.resolve_args("dev", arg_type)
+
+    def test_resolve_follows_model_copy(self) -> None:
+        """A copied config resolves its own environments, not the original's."""
+        config = TerraformBranchDeployConfig.model_validate(
+            {
+                "default-environment": "dev",
+                "production-environments": ["dev"],
+                "defaults": {"var-files": {"paths": ["common.tfvars"]}},
+                "environments": {"dev": {}},
+            }
+        )
+        config.resolve("dev")
+
+        copied = config.model_copy(update={"defaults": None})
+
+        assert copied.resolve("dev").var_files == ()
+        assert config.resolve("dev").var_files == ("common.tfvars",)
+
+    def test_resolve_bundles_inherited_settings(self) -> None:
+        """resolve() applies inheritance for every list in one call."""
+        config = TerraformBranchDeployConfig.model_validate(
+            {
+                "default-environment": "dev",
+                "production-environments": ["prod"],
+                "defaults": {
+                    "var-files": {"paths": ["common.tfvars"]},
+                    "init-args": {"args": ["-upgrade"]},
+                },
+                "environments": {
+                    "dev": {},
+                    "prod": {"plan-args": {"args": ["-parallelism=30"]}},
+                },
+            }
+        )
+
+        resolved = config.resolve("prod")
+
+        assert resolved.var_files == ("common.tfvars",)
+        assert resolved.init_args == ("-upgrade",)
+        assert resolved.plan_args == ("-parallelism=30",)
+        assert resolved.apply_args == ()
+        assert resolved.is_production
+        assert not config.resolve("dev").is_production
+
     def test_working_directory_default(self) -> None:
         """Test that working-directory defaults to current directory."""
         config = TerraformBranchDeployConfig.model_validate(
@@ -189,6 +268,27 @@ class TestLoadConfig:
         assert config.default_environment == "dev"
         assert config.get_environment("dev").working_directory == "./terraform/dev"
 
+    def test_encoding_is_detected_from_the_file(self, tmp_path: Path) -> None:
+        """YAML decodes the raw bytes, so BOM-marked UTF-16 files load too."""
+        config_file = tmp_path / ".tf-branch-deploy.yml"
+        config_file.write_text(
+            "# Zürich\ndefault-environment: dev\nproduction-environments: [dev]\n"
+            "environments: {dev: {}}\n",
+            encoding="utf-16",
+        )
+
+        assert load_config(config_file).default_environment == "dev"
+
+    def test_python_tags_rejected(self, tmp_path: Path) -> None:
+        """The fast loader must stay a safe loader."""
+        import yaml
+
+        config_file = tmp_path / ".tf-branch-deploy.yml"
+        config_file.write_text("default-environment: !!python/object/apply:os.getcwd []\n")
+
+        with pytest.raises(yaml.constructor.ConstructorError):
+            load_config(config_file)
+
 
 class TestJsonSchema:
     """Tests for JSON schema generation."""
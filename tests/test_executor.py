@@ -1,5 +1,8 @@
 """Unit tests for the Terraform executor module."""
 
+import os
+import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -39,6 +42,15 @@ class TestCommandResult:
         result = CommandResult(exit_code=1, stdout="", stderr="error", command=["ls"])
         assert result.success is False
 
+    def test_results_are_immutable_and_slotted(self) -> None:
+        """Results are frozen and carry no per-instance __dict__."""
+        import dataclasses
+
+        result = PlanResult(exit_code=0, stdout="", stderr="", command=[], has_changes=True)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.has_changes = False  # type: ignore[misc]
+        assert not hasattr(result, "__dict__")
+
 
 class TestPlanResult:
     """Tests for PlanResult dataclass."""
@@ -86,6 +98,22 @@ class TestTerraformExecutor:
         for name in GITHUB_TOKEN_ENV_VARS:
             assert name not in call_env
 
+    @patch("tf_branch_deploy.executor.subprocess.run")
+    def test_run_command_inherits_environment_when_nothing_to_strip(
+        self,
+        mock_run: MagicMock,
+        executor: TerraformExecutor,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Without tokens or overrides the parent environment is inherited, not copied."""
+        for name in GITHUB_TOKEN_ENV_VARS:
+            monkeypatch.delenv(name, raising=False)
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        executor._run_command(["terraform", "plan"])
+
+        assert mock_run.call_args.kwargs["env"] is None
+
     @patch("subprocess.run")
     def test_init_builds_correct_command(
         self, mock_run: MagicMock, executor: TerraformExecutor
@@ -106,6 +134,18 @@ class TestTerraformExecutor:
         assert "backends/dev.tfbackend" in args
         assert "-upgrade" in args
 
+    @patch("subprocess.run")
+    def test_plan_interleaves_var_files_in_order(
+        self, mock_run: MagicMock, executor: TerraformExecutor
+    ) -> None:
+        """Each var file is passed as its own -var-file pair, in config order."""
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+        executor.plan(out_file=Path("tfplan.bin"))
+
+        args = mock_run.call_args[0][0]
+        assert args[4:8] == ["-var-file", "common.tfvars", "-var-file", "dev.tfvars"]
+
     @patch("subprocess.run")
     def test_plan_builds_correct_command(
         self, mock_run: MagicMock, executor: TerraformExecutor, tmp_path: Path
@@ -335,18 +375,34 @@ class TestTerraformExecutor:
 class TestTfcmtIntegration:
     """Tests for tfcmt integration."""
 
+    @pytest.mark.parametrize("repo", ["org", "org/", "/repo", "org/repo/extra"])
+    def test_malformed_repo_rejected_at_construction(self, tmp_path: Path, repo: str) -> None:
+        """A repo that cannot be split into owner/name fails before any terraform runs."""
+        with pytest.raises(ValueError, match="owner/name"):
+            TerraformExecutor(working_directory=tmp_path, repo=repo)
+
     def test_tfcmt_not_available(self, executor: TerraformExecutor) -> None:
         """When tfcmt is not installed, returns False."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError()
+        with patch("tf_branch_deploy.executor.shutil.which", return_value=None):
             assert executor._tfcmt_available() is False
 
     def test_tfcmt_available(self, executor: TerraformExecutor) -> None:
         """When tfcmt is installed, returns True."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=0)
+        with patch("tf_branch_deploy.executor.shutil.which", return_value="/usr/bin/tfcmt"):
+            assert executor._tfcmt_available() is True
+
+    def test_tfcmt_lookup_is_cached_without_spawning(self, executor: TerraformExecutor) -> None:
+        """The PATH lookup runs once and never starts a tfcmt process."""
+        with (
+            patch("tf_branch_deploy.executor.shutil.which", return_value="/usr/bin/tfcmt") as which,
+            patch("subprocess.run") as mock_run,
+        ):
+            assert executor._tfcmt_available() is True
             assert executor._tfcmt_available() is True
 
+        which.assert_called_once_with("tfcmt")
+        mock_run.assert_not_called()
+
     def test_run_with_tfcmt_falls_back_without_credentials(
         self, executor: TerraformExecutor
     ) -> None:
@@ -513,3 +569,89 @@ class TestTimeout:
         executor._run_command(["terraform", "version"])
         _, kwargs = mock_run.call_args
         assert kwargs["timeout"] == 900
+
+
+class TestStreamedCommands:
+    """Tests for streaming command output instead of buffering it."""
+
+    def test_stream_echoes_stdout_and_keeps_stderr(self, tmp_path: Path) -> None:
+        """Streamed stdout is printed as it arrives and stderr is still captured."""
+        executor = TerraformExecutor(working_directory=tmp_path)
+        script = "import sys; print('line one'); print('line two'); sys.stderr.write('warn')"
+
+        with patch("tf_branch_deploy.executor.console.out") as mock_out:
+            result = executor._run_command([sys.executable, "-c", script], stream=True)
+
+        assert result.success
+        assert result.stdout == "line one\nline two\n"
+        assert result.stderr == "warn"
+        assert [c.args[0] for c in mock_out.call_args_list] == ["line one\n", "line two\n"]
+
+    def test_stream_keeps_only_the_stdout_tail(self, tmp_path: Path) -> None:
+        """Long outputs are not held in memory in full."""
+        executor = TerraformExecutor(working_directory=tmp_path)
+        script = "for i in range(1500): print(i)"
+
+        with (
+            patch("tf_branch_deploy.executor.STREAM_TAIL_LINES", 10),
+            patch("tf_branch_deploy.executor.console.out"),
+        ):
+            result = executor._run_command([sys.executable, "-c", script], stream=True)
+
+        assert result.stdout.splitlines() == [str(i) for i in range(1490, 1500)]
+
+    @pytest.mark.slow
+    def test_stream_timeout_kills_command(self, tmp_path: Path) -> None:
+        """A streamed command past the timeout is killed and reported as exit 124."""
+        executor = TerraformExecutor(working_directory=tmp_path, timeout=1)
+
+        result = executor._run_command(
+            [sys.executable, "-c", "import time; time.sleep(30)"], stream=True
+        )
+
+        assert result.exit_code == 124
+        assert "timed out" in result.stderr
+
+    @pytest.mark.parametrize("stream", [False, True])
+    def test_invalid_utf8_output_is_replaced(self, tmp_path: Path, stream: bool) -> None:
+        """Undecodable bytes in command output do not abort the run."""
+        executor = TerraformExecutor(working_directory=tmp_path)
+        script = "import sys; sys.stdout.buffer.write(b'ok \\xff\\n')"
+
+        with patch("tf_branch_deploy.executor.console.out"):
+            result = executor._run_command([sys.executable, "-c", script], stream=stream)
+
+        assert result.exit_code == 0
+        assert result.stdout == "ok �\n"
+
+    @pytest.mark.slow
+    @pytest.mark.skipif(os.name != "posix", reason="process groups are POSIX-only")
+    def test_stream_timeout_kills_grandchildren(self, tmp_path: Path) -> None:
+        """Children holding the output pipe open die with the command on timeout."""
+        executor = TerraformExecutor(working_directory=tmp_path, timeout=1)
+        script = (
+            "import subprocess, sys, time; "
+            "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+            "time.sleep(30)"
+        )
+
+        started = time.monotonic()
+        result = executor._run_command([sys.executable, "-c", script], stream=True)
+
+        assert result.exit_code == 124
+        assert time.monotonic() - started < 10
+
+    def test_plan_streams_when_enabled(self, tmp_path: Path) -> None:
+        """stream_output routes terraform plan through the streaming runner."""
+        executor = TerraformExecutor(working_directory=tmp_path, stream_output=True)
+
+        with (
+            patch.object(executor, "_tfcmt_available", return_value=False),
+            patch.object(executor, "_stream_command") as mock_stream,
+        ):
+            mock_stream.return_value = CommandResult(
+                exit_code=0, stdout="", stderr="", command=["terraform", "plan"]
+            )
+            executor.plan()
+
+        assert mock_stream.call_args.args[0][:2] == ["terraform", "plan"]
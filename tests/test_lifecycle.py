@@ -34,65 +34,72 @@ def _assert_relative_gh_api_args(args: list[str]) -> None:
 class TestLifecycleManager:
     """Tests for LifecycleManager."""
 
-    @pytest.fixture
-    def manager(self) -> LifecycleManager:
-        """Create a LifecycleManager instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def manager(cls) -> LifecycleManager:
+        """Create a LifecycleManager shared by the class; it holds no per-call state."""
         return LifecycleManager(repo="org/repo", github_token="test-token")
 
+    @pytest.mark.parametrize(
+        ("method", "call_args", "http_method", "endpoint", "fields"),
+        [
+            pytest.param(
+                "update_deployment_status",
+                ("123", "success", "prod"),
+                "POST",
+                "repos/org/repo/deployments/123/statuses",
+                ["state=success"],
+                id="update-deployment-status",
+            ),
+            pytest.param(
+                "remove_reaction",
+                ("456", "789"),
+                "DELETE",
+                "repos/org/repo/issues/comments/456/reactions/789",
+                [],
+                id="remove-reaction",
+            ),
+            pytest.param(
+                "add_reaction",
+                ("456", "rocket"),
+                "POST",
+                "repos/org/repo/issues/comments/456/reactions",
+                ["content=rocket"],
+                id="add-reaction",
+            ),
+            pytest.param(
+                "post_result_comment",
+                ("100", "body"),
+                "POST",
+                "repos/org/repo/issues/100/comments",
+                ["body=body"],
+                id="post-result-comment",
+            ),
+        ],
+    )
     @patch("tf_branch_deploy.lifecycle.subprocess.run")
-    def test_update_deployment_status(self, mock_run: MagicMock, manager: LifecycleManager) -> None:
-        """Test updating deployment status."""
-        mock_run.return_value = _gh_result()
-
-        manager.update_deployment_status("123", "success", "prod")
-
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[:4] == ["gh", "api", "--method", "POST"]
-        assert "repos/org/repo/deployments/123/statuses" in args
-        _assert_relative_gh_api_args(args)
-        assert "state=success" in args
-
-    @patch("tf_branch_deploy.lifecycle.subprocess.run")
-    def test_remove_reaction(self, mock_run: MagicMock, manager: LifecycleManager) -> None:
-        """Test removing reaction."""
-        mock_run.return_value = _gh_result()
-
-        manager.remove_reaction("456", "789")
-
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[:4] == ["gh", "api", "--method", "DELETE"]
-        assert "repos/org/repo/issues/comments/456/reactions/789" in args
-        _assert_relative_gh_api_args(args)
-
-    @patch("tf_branch_deploy.lifecycle.subprocess.run")
-    def test_add_reaction(self, mock_run: MagicMock, manager: LifecycleManager) -> None:
-        """Test adding reaction."""
-        mock_run.return_value = _gh_result()
-
-        manager.add_reaction("456", "rocket")
-
-        mock_run.assert_called_once()
-        args = mock_run.call_args[0][0]
-        assert args[:4] == ["gh", "api", "--method", "POST"]
-        assert "repos/org/repo/issues/comments/456/reactions" in args
-        _assert_relative_gh_api_args(args)
-        assert "content=rocket" in args
-
-    @patch("tf_branch_deploy.lifecycle.subprocess.run")
-    def test_post_result_comment(self, mock_run: MagicMock, manager: LifecycleManager) -> None:
-        """Test posting result comment."""
+    def test_gh_api_calls(
+        self,
+        mock_run: MagicMock,
+        manager: LifecycleManager,
+        method: str,
+        call_args: tuple[str, ...],
+        http_method: str,
+        endpoint: str,
+        fields: list[str],
+    ) -> None:
+        """Each lifecycle call makes one relative gh api request with its fields."""
         mock_run.return_value = _gh_result()
 
-        manager.post_result_comment("100", "body")
+        getattr(manager, method)(*call_args)
 
         mock_run.assert_called_once()
         args = mock_run.call_args[0][0]
-        assert args[:4] == ["gh", "api", "--method", "POST"]
-        assert "repos/org/repo/issues/100/comments" in args
+        assert args[:4] == ["gh", "api", "--method", http_method]
+        assert endpoint in args
         _assert_relative_gh_api_args(args)
-        assert "body=body" in args
+        missing = [field for field in fields if field not in args]
+        assert not missing, f"missing {missing} in {args!r}"
 
     @patch("tf_branch_deploy.lifecycle.subprocess.run")
     def test_lock_metadata_read_uses_explicit_get(
@@ -197,48 +204,61 @@ class TestLifecycleManager:
             assert call_env["GH_HOST"] == "git.i.company.com"
             assert call_env["GH_ENTERPRISE_TOKEN"] == "test-token"
 
-    def test_format_result_comment_success(self, manager: LifecycleManager) -> None:
-        """Test formatting success comment."""
-        env_vars = {
-            "TF_BD_ACTOR": "user",
-            "TF_BD_REF": "main",
-            "TF_BD_ENVIRONMENT": "prod",
-            "TF_BD_SHA": "abc1234",
-            "TF_BD_NOOP": "false",
-        }
-
-        body = manager.format_result_comment("success", env_vars)
-
-        assert "Deployment Results ✅" in body
-        assert "**user** successfully deployed branch `main` to **prod**" in body
-        assert "Details" in body
-        assert '"ref": "main"' in body
-
-    def test_format_result_comment_failure(self, manager: LifecycleManager) -> None:
-        """Test formatting failure comment."""
-        env_vars = {
-            "TF_BD_ACTOR": "user",
-            "TF_BD_REF": "feature",
-            "TF_BD_ENVIRONMENT": "dev",
-        }
-
-        body = manager.format_result_comment("failure", env_vars, failure_reason="Terraform failed")
-
-        assert "⚠️ Cannot proceed with deployment" in body
-        assert "Terraform failed" in body
-
-    def test_format_result_comment_noop(self, manager: LifecycleManager) -> None:
-        """Test formatting noop success comment."""
-        env_vars = {
-            "TF_BD_ACTOR": "user",
-            "TF_BD_REF": "main",
-            "TF_BD_ENVIRONMENT": "prod",
-            "TF_BD_NOOP": "true",
-        }
-
-        body = manager.format_result_comment("success", env_vars)
-
-        assert "**noop** deployed" in body
+    @pytest.mark.parametrize(
+        ("status", "env_vars", "failure_reason", "expected"),
+        [
+            pytest.param(
+                "success",
+                {
+                    "TF_BD_ACTOR": "user",
+                    "TF_BD_REF": "main",
+                    "TF_BD_ENVIRONMENT": "prod",
+                    "TF_BD_SHA": "abc1234",
+                    "TF_BD_NOOP": "false",
+                },
+                None,
+                [
+                    "Deployment Results ✅",
+                    "**user** successfully deployed branch `main` to **prod**",
+                    "Details",
+                    '"ref": "main"',
+                ],
+                id="success",
+            ),
+            pytest.param(
+                "failure",
+                {"TF_BD_ACTOR": "user", "TF_BD_REF": "feature", "TF_BD_ENVIRONMENT": "dev"},
+                "Terraform failed",
+                ["⚠️ Cannot proceed with deployment", "Terraform failed"],
+                id="failure",
+            ),
+            pytest.param(
+                "success",
+                {
+                    "TF_BD_ACTOR": "user",
+                    "TF_BD_REF": "main",
+                    "TF_BD_ENVIRONMENT": "prod",
+                    "TF_BD_NOOP": "true",
+                },
+                None,
+                ["**noop** deployed"],
+                id="noop",
+            ),
+        ],
+    )
+    def test_format_result_comment(
+        self,
+        manager: LifecycleManager,
+        status: str,
+        env_vars: dict[str, str],
+        failure_reason: str | None,
+        expected: list[str],
+    ) -> None:
+        """Result comments carry the status header, message and metadata."""
+        body = manager.format_result_comment(status, env_vars, failure_reason=failure_reason)
+
+        missing = [text for text in expected if text not in body]
+        assert not missing, f"missing {missing} in comment:\n{body}"
 
     # GHE Support Tests
 
@@ -263,47 +283,38 @@ class TestLifecycleManager:
     @pytest.mark.parametrize(
         ("server_url", "expected_host"),
         [
-            ("https://company.ghe.com", "company.ghe.com"),
-            ("https://git.i.company.com", "git.i.company.com"),
+            pytest.param("https://company.ghe.com", "company.ghe.com", id="ghec"),
+            pytest.param("https://git.i.company.com", "git.i.company.com", id="ghes"),
+            pytest.param("https://github.com", None, id="github-com"),
         ],
     )
     @patch("tf_branch_deploy.lifecycle.subprocess.run")
-    def test_run_gh_sets_gh_host_for_enterprise_hosts(
+    def test_run_gh_sets_gh_host_from_server_url(
         self,
         mock_run: MagicMock,
         manager: LifecycleManager,
         server_url: str,
-        expected_host: str,
+        expected_host: str | None,
     ) -> None:
-        """GitHub CLI calls must target GHEC data residency and GHES hosts."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        ghe_env = {"GITHUB_SERVER_URL": server_url}
+        """gh targets GHEC data residency and GHES hosts, but not github.com."""
+        mock_run.return_value = _gh_result()
 
-        with patch.dict(os.environ, ghe_env, clear=True):
+        with patch.dict(os.environ, {"GITHUB_SERVER_URL": server_url}, clear=True):
             manager._run_gh(["gh", "api", "repos/org/repo/issues"])
 
         call_env = mock_run.call_args[1]["env"]
-        assert call_env["GH_HOST"] == expected_host
+        assert call_env.get("GH_HOST") == expected_host
         assert call_env["GITHUB_TOKEN"] == "test-token"
         assert call_env["GH_TOKEN"] == "test-token"
         assert call_env["GH_ENTERPRISE_TOKEN"] == "test-token"
 
     @patch("tf_branch_deploy.lifecycle.subprocess.run")
-    def test_run_gh_does_not_set_gh_host_for_github_com(
-        self, mock_run: MagicMock, manager: LifecycleManager
-    ) -> None:
-        """Test that GH_HOST is NOT set for github.com."""
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_run.return_value = mock_result
-
-        env = {"GITHUB_SERVER_URL": "https://github.com"}
+    def test_run_gh_inherits_environment_without_overrides(self, mock_run: MagicMock) -> None:
+        """Without a token or GHE host, gh inherits the environment instead of a copy."""
+        mock_run.return_value = _gh_result()
+        manager = LifecycleManager(repo="org/repo", github_token=None)
 
-        with patch.dict(os.environ, env, clear=True):
-            manager._run_gh(["gh", "api", "repos/org/repo/issues"])
+        with patch.dict(os.environ, {"GITHUB_SERVER_URL": "https://github.com"}, clear=True):
+            manager._run_gh(["gh", "version"])
 
-        call_env = mock_run.call_args[1]["env"]
-        assert "GH_HOST" not in call_env
+        assert mock_run.call_args[1]["env"] is None